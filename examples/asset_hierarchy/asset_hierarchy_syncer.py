@@ -46,15 +46,16 @@ class AssetHierarchySyncer(Syncer):
                 self._note_comment_handler,
             ],
         )
+        self._handlers = (
+            self._enable_syncing_handler,
+            self._task_issue_handler,
+            self._note_comment_handler,
+            self._asset_issue_handler,
+        )
 
     @property
     def handlers(self):
         """
-        Return a list of :class:`~handlers.SyncHandler` instances.
+        Return a tuple of :class:`~handlers.SyncHandler` instances.
         """
-        return [
-            self._enable_syncing_handler,
-            self._task_issue_handler,
-            self._note_comment_handler,
-            self._asset_issue_handler,
-        ]
+        return self._handlers
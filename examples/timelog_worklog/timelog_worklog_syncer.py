@@ -54,15 +54,16 @@ class TimelogWorklogSyncer(Syncer):
                 self._timelog_worklog_handler,
             ],
         )
+        self._handlers = (
+            self._enable_syncing_handler,
+            self._task_issue_handler,
+            self._note_comment_handler,
+            self._timelog_worklog_handler,
+        )
 
     @property
     def handlers(self):
         """
-        Return a list of :class:`~handlers.SyncHandler` instances.
+        Return a tuple of :class:`~handlers.SyncHandler` instances.
         """
-        return [
-            self._enable_syncing_handler,
-            self._task_issue_handler,
-            self._note_comment_handler,
-            self._timelog_worklog_handler,
-        ]
+        return self._handlers
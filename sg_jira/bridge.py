@@ -92,6 +92,9 @@ class Bridge(object):
         )
         shotgun.add_user_agent("sg_jira_sync")
         shotgun.setup()
+        # Keep this connection for the current thread, so we don't open a new
+        # one the first time the bridge is used from it.
+        self._SG_CACHED_CONNECTIONS.sg = shotgun
 
         self._jira_user = jira_user
         options = (
@@ -87,8 +87,9 @@ class EnableSyncingHandler(SyncHandler):
         # Run the primary handler, stop processing if the primary handler
         # didn't perform anything.
         self._logger.debug(
-            "Dispatching event to primary handler %s. Event: %s"
-            % (self._primary_handler, event)
+            "Dispatching event to primary handler %s. Event: %s",
+            self._primary_handler,
+            event,
         )
         if not self._primary_handler.process_shotgun_event(
             entity_type,
@@ -100,8 +101,7 @@ class EnableSyncingHandler(SyncHandler):
         # Run all the secondary handlers
         for handler in self._secondary_handlers:
             self._logger.debug(
-                "Dispatching event to secondary handler %s. Event: %s"
-                % (handler, event)
+                "Dispatching event to secondary handler %s. Event: %s", handler, event
             )
             handler.process_shotgun_event(
                 entity_type,
@@ -28,6 +28,9 @@ class EntityIssueHandler(SyncHandler):
     # https://regex101.com/r/E1ysHQ/1
     ACCOUNT_ID_RE = re.compile("^[0-9a-f:-]{20}")
 
+    # Jira webhook events this handler can process.
+    _SUPPORTED_WEBHOOK_EVENTS = ("jira:issue_updated", "jira:issue_created")
+
     def __init__(self, syncer, issue_type):
         """
         Instantiate an Entity Issue handler for the given syncer.
@@ -46,6 +49,12 @@ class EntityIssueHandler(SyncHandler):
         else:
             self._jira_user_to_shotgun = self._jira_server_user_to_shotgun
 
+        # The Jira custom fields used to store the linked Flow Production Tracking
+        # Entity are resolved once when the Jira session is set up, so we can
+        # keep their ids around instead of retrieving them for every event.
+        self._jira_shotgun_id_field = self._jira.jira_shotgun_id_field
+        self._jira_shotgun_type_field = self._jira.jira_shotgun_type_field
+
     def accept_jira_event(self, resource_type, resource_id, event):
         """
         Accept or reject the given event for the given Jira resource.
@@ -63,54 +72,56 @@ class EntityIssueHandler(SyncHandler):
             return False
         # Check the event payload and reject the event if we don't have what we
         # expect
-        jira_issue = event.get("issue")
-        if not jira_issue:
-            self._logger.debug("Rejecting event without an issue: %s" % event)
+        try:
+            jira_issue = event["issue"]
+            webhook_event = event["webhookEvent"]
+            changelog = event["changelog"]
+            fields = jira_issue["fields"]
+            issue_type = fields["issuetype"]
+        except KeyError as e:
+            self._logger.debug("Rejecting event with missing %s: %s", e, event)
             return False
-
-        webhook_event = event.get("webhookEvent")
-        if not webhook_event or webhook_event not in [
-            "jira:issue_updated",
-            "jira:issue_created",
-        ]:
+        except TypeError as e:
+            # Raised if the payload or one of its values is not a dictionary,
+            # e.g. None.
             self._logger.debug(
-                "Rejecting event with an unsupported webhook event '%s': %s"
-                % (webhook_event, event)
+                "Rejecting event with an invalid payload (%s: %s): %s",
+                type(e).__name__,
+                e,
+                event,
             )
             return False
 
-        changelog = event.get("changelog")
-        if not changelog:
-            self._logger.debug("Rejecting event without a changelog: %s" % event)
+        if webhook_event not in self._SUPPORTED_WEBHOOK_EVENTS:
+            self._logger.debug(
+                "Rejecting event with an unsupported webhook event '%s': %s",
+                webhook_event,
+                event,
+            )
             return False
 
-        fields = jira_issue.get("fields")
-        if not fields:
-            self._logger.debug("Rejecting event without issue fields: %s" % event)
+        if not changelog or not fields or not issue_type:
+            self._logger.debug(
+                "Rejecting event without a changelog, issue fields or issue "
+                "type: %s",
+                event,
+            )
             return False
 
-        issue_type = fields.get("issuetype")
-        if not issue_type:
-            self._logger.debug("Rejecting event without an issue type: %s" % event)
-            return False
         if issue_type["name"] != self._issue_type:
             self._logger.debug(
-                "Rejecting event without a %s issue type: %s"
-                % (self._issue_type, event)
+                "Rejecting event without a %s issue type: %s", self._issue_type, event
             )
             return False
 
-        shotgun_id = fields.get(self._jira.jira_shotgun_id_field)
-        shotgun_type = fields.get(self._jira.jira_shotgun_type_field)
+        shotgun_id = fields.get(self._jira_shotgun_id_field)
+        shotgun_type = fields.get(self._jira_shotgun_type_field)
         if not shotgun_id or not shotgun_type:
             self._logger.debug(
-                "Rejecting event for %s %s. It's not linked to a Shotgun "
-                "Entity: %s"
-                % (
-                    issue_type["name"],
-                    resource_id,
-                    event,
-                )
+                "Rejecting event for %s %s. It's not linked to a Shotgun Entity: %s",
+                issue_type["name"],
+                resource_id,
+                event,
             )
             return False
 
@@ -138,10 +149,8 @@ class EntityIssueHandler(SyncHandler):
             )
             return None
 
-        jira_shotgun_id = getattr(jira_issue.fields, self._jira.jira_shotgun_id_field)
-        jira_shotgun_type = getattr(
-            jira_issue.fields, self._jira.jira_shotgun_type_field
-        )
+        jira_shotgun_id = getattr(jira_issue.fields, self._jira_shotgun_id_field)
+        jira_shotgun_type = getattr(jira_issue.fields, self._jira_shotgun_type_field)
         if shotgun_entity["type"] != jira_shotgun_type or shotgun_entity["id"] != int(
             jira_shotgun_id
         ):
@@ -210,8 +219,8 @@ class EntityIssueHandler(SyncHandler):
             "project": jira_project.raw,
             "summary": summary.replace("\n", "").replace("\r", ""),
             "description": description,
-            self._jira.jira_shotgun_id_field: "%d" % sg_entity["id"],
-            self._jira.jira_shotgun_type_field: sg_entity["type"],
+            self._jira_shotgun_id_field: "%d" % sg_entity["id"],
+            self._jira_shotgun_type_field: sg_entity["type"],
             self._jira.jira_shotgun_url_field: shotgun_url,
             "reporter": reporter,
         }
@@ -663,8 +672,9 @@ class EntityIssueHandler(SyncHandler):
                     # No need to check if the user is in the current watchers list:
                     # Jira handles that gracefully.
                     self._logger.debug(
-                        "Removing %s from %s watchers list."
-                        % (jira_user.displayName, jira_issue)
+                        "Removing %s from %s watchers list.",
+                        jira_user.displayName,
+                        jira_issue,
                     )
                     # In older versions of the client (<= 3.0) we used jira_user.user_id
                     # However, newer versions of the remove_watcher method supports name search
@@ -682,8 +692,9 @@ class EntityIssueHandler(SyncHandler):
                 )
                 if jira_user:
                     self._logger.debug(
-                        "Adding %s to %s watchers list."
-                        % (jira_user.displayName, jira_issue)
+                        "Adding %s to %s watchers list.",
+                        jira_user.displayName,
+                        jira_issue,
                     )
                     # add_watcher method supports both user_id and accountId properties
                     self._jira.add_watcher(jira_issue, jira_user.accountId)
@@ -713,17 +724,56 @@ class EntityIssueHandler(SyncHandler):
         fields = jira_issue["fields"]
         issue_type = fields["issuetype"]
 
-        shotgun_id = fields.get(self._jira.jira_shotgun_id_field)
-        if not shotgun_id.isdigit():
+        shotgun_id = fields.get(self._jira_shotgun_id_field)
+        try:
+            shotgun_id = int(shotgun_id)
+        except (TypeError, ValueError):
             raise ValueError(
                 "Invalid Flow Production Tracking id %s, it must be an integer"
                 % shotgun_id
             )
-        shotgun_type = fields.get(self._jira.jira_shotgun_type_field)
+        shotgun_type = fields.get(self._jira_shotgun_type_field)
+
+        # The presence of the changelog key has been validated by the accept method.
+        # Only keep changes for Jira fields we have a Flow Production Tracking
+        # target for, so we don't query Flow Production Tracking for nothing.
+        changes = []
+        # Jira is not consistent with the case of some field ids, e.g. a change
+        # can be reported for "dueDate" while the Issue payload has "duedate".
+        # Use the field ids from the payload, so the changes can be matched
+        # with our mappings and with the Issue values.
+        issue_field_ids = dict((field.lower(), field) for field in fields)
+        for change in event["changelog"]["items"]:
+            # Depending on the Jira server version, we can get the Jira field id
+            # in the change payload or just the field name.
+            # If we don't have the field id, retrieve it from our internal mapping.
+            field_id = change.get("fieldId") or self._jira.get_jira_issue_field_id(
+                change["field"]
+            )
+            if field_id:
+                field_id = issue_field_ids.get(field_id.lower(), field_id)
+            if not field_id or not self._get_shotgun_entity_field_for_issue_field(
+                field_id
+            ):
+                self._logger.debug(
+                    "Ignoring Jira change %s for unsupported field %s", change, field_id
+                )
+                continue
+            changes.append((field_id, change))
+
+        if not changes:
+            self._logger.debug(
+                "Rejecting Jira event for %s (%s) without any supported change: %s",
+                issue_type["name"],
+                resource_id,
+                event,
+            )
+            return False
+
         # Collect the list of fields we might need to process the event
         sg_fields = self._supported_shotgun_fields_for_jira_event
         sg_entity = self._shotgun.consolidate_entity(
-            {"type": shotgun_type, "id": int(shotgun_id)},
+            {"type": shotgun_type, "id": shotgun_id},
             fields=sg_fields,
         )
         if not sg_entity:
@@ -735,30 +785,18 @@ class EntityIssueHandler(SyncHandler):
             )
             return False
 
-        # The presence of the changelog key has been validated by the accept method.
-        changes = event["changelog"]["items"]
         shotgun_data = {}
 
         self._logger.debug(
-            "Attempting to sync %s (%s) to Flow Production Tracking %s (%d) for event %s"
-            % (
-                issue_type["name"],
-                resource_id,
-                sg_entity["type"],
-                sg_entity["id"],
-                event,
-            )
+            "Attempting to sync %s (%s) to Flow Production Tracking %s (%d) for event %s",
+            issue_type["name"],
+            resource_id,
+            sg_entity["type"],
+            sg_entity["id"],
+            event,
         )
-        for change in changes:
-            # Depending on the Jira server version, we can get the Jira field id
-            # in the change payload or just the field name.
-            # If we don't have the field id, retrieve it from our internal mapping.
-            field_id = change.get("fieldId") or self._jira.get_jira_issue_field_id(
-                change["field"]
-            )
-            self._logger.debug(
-                "Treating Jira change %s for field %s" % (change, field_id)
-            )
+        for field_id, change in changes:
+            self._logger.debug("Treating Jira change %s for field %s", change, field_id)
             try:
                 (
                     shotgun_field,
@@ -795,7 +833,7 @@ class EntityIssueHandler(SyncHandler):
                         e,
                     )
                 )
-                self._logger.debug("Jira event: %s" % event)
+                self._logger.debug("Jira event: %s", event)
 
         if shotgun_data:
             self._logger.debug(
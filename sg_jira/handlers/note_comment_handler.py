@@ -163,8 +163,9 @@ class NoteCommentHandler(SyncHandler):
         field = meta["attribute_name"]
         if field not in self._supported_shotgun_fields_for_shotgun_event():
             self._logger.debug(
-                "Rejecting Shotgun event for unsupported Shotgun field %s: %s"
-                % (field, event)
+                "Rejecting Shotgun event for unsupported Shotgun field %s: %s",
+                field,
+                event,
             )
             return False
 
@@ -252,8 +253,9 @@ class NoteCommentHandler(SyncHandler):
         if sg_entity[SHOTGUN_JIRA_ID_FIELD] and meta.get("in_create"):
             self._logger.debug(
                 "Rejecting Shotgun event for Note.%s field update during "
-                "create. Comment was already created in Jira: %s"
-                % (shotgun_field, event)
+                "create. Comment was already created in Jira: %s",
+                shotgun_field,
+                event,
             )
             return False
 
@@ -465,23 +467,25 @@ class NoteCommentHandler(SyncHandler):
         # expect
         jira_issue = event.get("issue")
         if not jira_issue:
-            self._logger.debug("Rejecting event without an issue: %s" % event)
+            self._logger.debug("Rejecting event without an issue: %s", event)
             return False
 
         jira_comment = event.get("comment")
         if not jira_comment:
-            self._logger.debug("Rejecting event without a comment: %s" % event)
+            self._logger.debug("Rejecting event without a comment: %s", event)
             return False
 
         webhook_event = event.get("webhookEvent")
         if not webhook_event:
-            self._logger.debug("Rejecting event without a webhookEvent: %s" % event)
+            self._logger.debug("Rejecting event without a webhookEvent: %s", event)
             return False
 
         if webhook_event != "comment_updated":
             self._logger.debug(
                 "Rejecting event with unsupported webhookEvent %s. Handler only "
-                "accepts comment_updated events: %s" % (webhook_event, event)
+                "accepts comment_updated events: %s",
+                webhook_event,
+                event,
             )
             return False
 
@@ -545,7 +549,7 @@ class NoteCommentHandler(SyncHandler):
                 sg_notes[0]["id"],
             )
         )
-        self._logger.debug("Jira event: %s" % event)
+        self._logger.debug("Jira event: %s", event)
 
         sg_data = {}
         try:
@@ -27,11 +27,39 @@ class TaskIssueHandler(EntityIssueHandler):
     # directly.
     __TASK_FIELDS_MAPPING = TASK_FIELDS_MAPPING
 
+    # Task fields always needed when processing a Flow Production Tracking
+    # event, on top of the fields we sync.
+    __TASK_QUERY_FIELDS = (
+        "content",
+        "task_assignees",
+        "created_by",
+        "project",
+        "project.Project.%s" % SHOTGUN_JIRA_ID_FIELD,
+        "project.Project.name",
+        SHOTGUN_JIRA_ID_FIELD,
+        SHOTGUN_SYNC_IN_JIRA_FIELD,
+    )
+
     # Define the mapping between Jira Issue fields and Shotgun Task fields
     # if the Shotgun target is None, it means the target field is not settable
     # directly.
     __ISSUE_FIELDS_MAPPING = TASK_ISSUE_FIELDS_MAPPING
 
+    def __init__(self, syncer, issue_type):
+        """
+        Instantiate a Task Issue handler for the given syncer.
+
+        :param syncer: A :class:`~sg_jira.Syncer` instance.
+        :param str issue_type: A target Issue type, e.g. 'Task', 'Story'.
+        """
+        super(TaskIssueHandler, self).__init__(syncer, issue_type)
+        # Flow Production Tracking fields which can't be synced with a direct
+        # Jira Issue update and the methods handling their changes.
+        self._shotgun_special_fields_handlers = {
+            "sg_status_list": self._sync_shotgun_status_event_to_jira,
+            "addressings_cc": self._sync_shotgun_cced_event_to_jira,
+        }
+
     @property
     def _sg_jira_status_mapping(self):
         """
@@ -99,8 +127,9 @@ class TaskIssueHandler(EntityIssueHandler):
 
         if field not in self._supported_shotgun_fields_for_shotgun_event():
             self._logger.debug(
-                "Rejecting Shotgun event for unsupported Shotgun field %s: %s"
-                % (field, event)
+                "Rejecting Shotgun event for unsupported Shotgun field %s: %s",
+                field,
+                event,
             )
             return False
 
@@ -119,16 +148,10 @@ class TaskIssueHandler(EntityIssueHandler):
         meta = event["meta"]
         shotgun_field = meta["attribute_name"]
 
-        task_fields = [
-            "content",
-            "task_assignees",
-            "created_by",
-            "project",
-            "project.Project.%s" % SHOTGUN_JIRA_ID_FIELD,
-            "project.Project.name",
-            SHOTGUN_JIRA_ID_FIELD,
-            SHOTGUN_SYNC_IN_JIRA_FIELD,
-        ] + self._supported_shotgun_fields_for_shotgun_event()
+        task_fields = (
+            list(self.__TASK_QUERY_FIELDS)
+            + self._supported_shotgun_fields_for_shotgun_event()
+        )
 
         sg_entity = self._shotgun.consolidate_entity(
             {"type": entity_type, "id": entity_id}, fields=task_fields
@@ -151,13 +174,11 @@ class TaskIssueHandler(EntityIssueHandler):
         if not jira_project_key:
             self._logger.debug(
                 "Skipping Shotgun event for %s (%d). Entity's Project %s "
-                "is not linked to a Jira Project. Event: %s"
-                % (
-                    entity_type,
-                    entity_id,
-                    sg_entity["project"],
-                    event,
-                )
+                "is not linked to a Jira Project. Event: %s",
+                entity_type,
+                entity_id,
+                sg_entity["project"],
+                event,
             )
             return False
         jira_project = self.get_jira_project(jira_project_key)
@@ -188,8 +209,10 @@ class TaskIssueHandler(EntityIssueHandler):
         if sg_entity[SHOTGUN_JIRA_ID_FIELD] and meta.get("in_create"):
             self._logger.debug(
                 "Rejecting Shotgun event for %s.%s field update during "
-                "create. Issue was already created in Jira: %s"
-                % (sg_entity["type"], shotgun_field, event)
+                "create. Issue was already created in Jira: %s",
+                sg_entity["type"],
+                shotgun_field,
+                event,
             )
             return False
 
@@ -254,7 +277,7 @@ class TaskIssueHandler(EntityIssueHandler):
                 jira_issue.key,
             )
         )
-        self._logger.debug("Shotgun event: %s" % event)
+        self._logger.debug("Shotgun event: %s", event)
 
         try:
             # Note: the returned jira_field will be None for the special cases handled
@@ -282,30 +305,58 @@ class TaskIssueHandler(EntityIssueHandler):
 
         if jira_field:
             self._logger.debug(
-                "Updating %s to %s in Jira for %s"
-                % (jira_field, jira_value, jira_issue)
+                "Updating %s to %s in Jira for %s", jira_field, jira_value, jira_issue
             )
             jira_issue.update(fields={jira_field: jira_value})
             return True
 
         # Special cases not handled by a direct update
-        if sg_field == "sg_status_list":
-            shotgun_status = event["meta"]["new_value"]
-            return self._sync_shotgun_status_to_jira(
-                jira_issue,
-                shotgun_status,
-                "Updated from Shotgun %s (%d) moving to %s"
-                % (entity_type, entity_id, shotgun_status),
-            )
-        if sg_field == "addressings_cc":
-            self._sync_shotgun_cced_changes_to_jira(
-                jira_issue,
-                event["meta"]["added"],
-                event["meta"]["removed"],
-            )
-            return True
+        special_handler = self._shotgun_special_fields_handlers.get(sg_field)
+        if special_handler:
+            return special_handler(jira_issue, entity_type, entity_id, event)
         return False
 
+    def _sync_shotgun_status_event_to_jira(
+        self, jira_issue, entity_type, entity_id, event
+    ):
+        """
+        Update the given Jira Issue status from the given Flow Production Tracking
+        status change event.
+
+        :param jira_issue: A :class:`jira.Issue` instance.
+        :param str entity_type: The Flow Production Tracking Entity type to sync.
+        :param int entity_id: The id of the Flow Production Tracking Entity to sync.
+        :param event: A dictionary with the event meta data for the change.
+        :returns: `True` if the status was successfully set, `False` otherwise.
+        """
+        shotgun_status = event["meta"]["new_value"]
+        return self._sync_shotgun_status_to_jira(
+            jira_issue,
+            shotgun_status,
+            "Updated from Shotgun %s (%d) moving to %s"
+            % (entity_type, entity_id, shotgun_status),
+        )
+
+    def _sync_shotgun_cced_event_to_jira(
+        self, jira_issue, entity_type, entity_id, event
+    ):
+        """
+        Update the given Jira Issue watchers from the given Flow Production
+        Tracking addressings_cc change event.
+
+        :param jira_issue: A :class:`jira.Issue` instance.
+        :param str entity_type: The Flow Production Tracking Entity type to sync.
+        :param int entity_id: The id of the Flow Production Tracking Entity to sync.
+        :param event: A dictionary with the event meta data for the change.
+        :returns: `True`.
+        """
+        self._sync_shotgun_cced_changes_to_jira(
+            jira_issue,
+            event["meta"]["added"],
+            event["meta"]["removed"],
+        )
+        return True
+
     def _get_jira_issue_field_for_shotgun_field(
         self, shotgun_entity_type, shotgun_field
     ):
@@ -391,7 +442,7 @@ class TaskIssueHandler(EntityIssueHandler):
                 )
                 self._logger.debug("%s" % e, exc_info=True)
         if issue_data:
-            self._logger.debug("Updating Jira %s with %s" % (jira_issue, issue_data))
+            self._logger.debug("Updating Jira %s with %s", jira_issue, issue_data)
             jira_issue.update(fields=issue_data)
 
         # Sync status
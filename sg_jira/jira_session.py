@@ -71,13 +71,15 @@ class JiraSession(jira.client.JIRA):
             )
 
         # accountId's are only found on JIRA Cloud. The latest version of JIRA server do not have them.
-        self._is_jira_cloud = "accountId" in self.myself()
+        # Retrieve the current user once, each call is a round trip to the server.
+        myself = self.myself()
+        self._is_jira_cloud = "accountId" in myself
         self._account_id_field = "accountId" if self._is_jira_cloud else "key"
 
         logger.info(
             "Connected to %s on %s (JIRA %s)"
             % (
-                self.myself()[self._account_id_field],
+                myself[self._account_id_field],
                 jira_site,
                 "Cloud" if self._is_jira_cloud else "Server",
             )
@@ -54,8 +54,12 @@ class Syncer(object):
     @property
     def handlers(self):
         """
-        Needs to be re-implemented in deriving classes and return a list of
-        :class:`~handlers.SyncHandler` instances.
+        Needs to be re-implemented in deriving classes and return a list or tuple
+        of :class:`~handlers.SyncHandler` instances.
+
+        Handlers are shared by all the events dispatched to the syncer, so they
+        should be built once in ``__init__`` and returned as a tuple, instead of
+        being instantiated each time this property is accessed.
         """
         raise NotImplementedError
 
@@ -96,26 +100,24 @@ class Syncer(object):
 
         # Check we have a Project
         if not event.get("project"):
-            self._logger.debug("Rejecting event %s with no project." % event)
+            self._logger.debug("Rejecting event %s with no project.", event)
             return None
 
         # Check the event meta data
         meta = event.get("meta")
         if not meta:
-            self._logger.debug("Rejecting event %s with no meta data." % event)
+            self._logger.debug("Rejecting event %s with no meta data.", event)
             return None
 
         if meta.get("type") != "attribute_change":
             self._logger.debug(
-                "Rejecting event %s with wrong or missing event type." % event
+                "Rejecting event %s with wrong or missing event type.", event
             )
             return None
 
         field = meta.get("attribute_name")
         if not field:
-            self._logger.debug(
-                "Rejecting event %s with missing attribute name." % (event)
-            )
+            self._logger.debug("Rejecting event %s with missing attribute name.", event)
             return None
 
         # Check we didn't trigger the event to avoid infinite loops.
@@ -126,7 +128,7 @@ class Syncer(object):
                 user["type"] == current_user["type"]
                 and user["id"] == current_user["id"]
             ):
-                self._logger.debug("Rejecting event %s created by us." % event)
+                self._logger.debug("Rejecting event %s created by us.", event)
                 return None
 
         # Loop over all handlers and return the first one which accepts the
@@ -142,11 +144,7 @@ class Syncer(object):
                 return handler
 
         self._logger.debug(
-            "Event %s was rejected by all handlers %s"
-            % (
-                event,
-                self.handlers,
-            )
+            "Event %s was rejected by all handlers %s", event, self.handlers
         )
         return None
 
@@ -168,11 +166,7 @@ class Syncer(object):
                 and user["accountId"] == self.bridge.jira.myself()["accountId"]
             ):
                 self._logger.debug(
-                    "Rejecting event %s triggered by us (%s)"
-                    % (
-                        event,
-                        user["accountId"],
-                    )
+                    "Rejecting event %s triggered by us (%s)", event, user["accountId"]
                 )
                 return None
 
@@ -188,11 +182,7 @@ class Syncer(object):
                 and user["name"].lower() == self.bridge.current_jira_username.lower()
             ):
                 self._logger.debug(
-                    "Rejecting event %s triggered by us (%s)"
-                    % (
-                        event,
-                        user["name"],
-                    )
+                    "Rejecting event %s triggered by us (%s)", event, user["name"]
                 )
                 return None
 
@@ -205,11 +195,9 @@ class Syncer(object):
                 == self.bridge.current_jira_username.lower()
             ):
                 self._logger.debug(
-                    "Rejecting event %s triggered by us (%s)"
-                    % (
-                        event,
-                        user["emailAddress"],
-                    )
+                    "Rejecting event %s triggered by us (%s)",
+                    event,
+                    user["emailAddress"],
                 )
                 return None
 
@@ -226,10 +214,6 @@ class Syncer(object):
                 return handler
 
         self._logger.debug(
-            "Event %s was rejected by all handlers %s"
-            % (
-                event,
-                self.handlers,
-            )
+            "Event %s was rejected by all handlers %s", event, self.handlers
         )
         return None
@@ -35,15 +35,15 @@ def utf8_to_unicode(value):
     if isinstance(value, dict):
         # Convert the keys and the values
         decoded = {}
+        # Collect existing unicode keys once to check for conflicts.
+        unicode_keys = frozenset(x for x in value if isinstance(x, six.text_type))
         for k, v in value.items():
             # We need to check if there is a potential conflict between the
             # decoded key and an existing unicode key, so we can't blindly call
             # our self here.
             if isinstance(k, str):
                 decoded_key = six.ensure_text(k)
-                if decoded_key in [
-                    x for x in value.keys() if isinstance(x, six.text_type)
-                ]:
+                if decoded_key in unicode_keys:
                     raise ValueError(
                         "UTF-8 decoded key %s is already present in dictionary "
                         "being decoded" % (decoded_key,)
@@ -86,13 +86,15 @@ def unicode_to_utf8(value):
     if isinstance(value, dict):
         # Convert the keys and the values.
         encoded = {}
+        # Collect existing str keys once to check for conflicts.
+        str_keys = frozenset(x for x in value if isinstance(x, str))
         for k, v in value.items():
             # We need to check if there is a potential conflict between the
             # encoded key and an existing str key, so we can't blindly call
             # our self here.
             if isinstance(k, six.text_type):
                 encoded_key = six.ensure_str(k)
-                if encoded_key in [x for x in value.keys() if isinstance(x, str)]:
+                if encoded_key in str_keys:
                     # Note: we issue the error with the unicode value to be
                     # consistent with our convention where everything is unicode
                     # and don't get potential problems with an utf-8 encoded string
@@ -7,13 +7,63 @@
 
 DESCRIPTION = """
 A script to generate Flow Production Tracking schema for Mockgun.
+
+Existing schema files are always regenerated, unless --max-age is used to keep
+the ones which are more recent than the given age. File modification times are
+reset when files are checked out, so only use it for files generated locally.
 """
 import argparse
 import os
+import pickle
+import pickletools
+import tempfile
+import time
 import getpass
 
 from shotgun_api3 import Shotgun
-from shotgun_api3.lib import mockgun
+
+# Tests only run with Python 3, so use the most compact and fastest to load
+# pickle protocol instead of the Python 2 compatible one used by
+# mockgun.generate_schema.
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def schema_files_are_fresh(paths, max_age):
+    """
+    Return True if all the given schema files exist and are not older than the
+    given maximum age.
+
+    :param paths: A list of file paths.
+    :param float max_age: A maximum age, in hours.
+    """
+    now = time.time()
+    for path in paths:
+        if not os.path.exists(path):
+            return False
+        if now - os.path.getmtime(path) > max_age * 3600:
+            return False
+    return True
+
+
+def write_pickle(data, path):
+    """
+    Pickle the given data to the given file path.
+
+    The data is written to a temporary file which is then moved in place, so
+    an interrupted run can't leave a truncated schema file behind.
+
+    :param data: The data to pickle.
+    :param str path: Full path to the output file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            # Remove unused memo opcodes from the pickle.
+            fh.write(pickletools.optimize(pickle.dumps(data, protocol=PICKLE_PROTOCOL)))
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
 
 
 def main():
@@ -28,18 +78,34 @@ def main():
         help="A PTR site url, a script name and its key",
         required=True,
     )
+    parser.add_argument(
+        "--max-age",
+        help="Keep existing schema files if they are not older than this "
+        "number of hours. By default, they are always regenerated.",
+        type=float,
+    )
     args = parser.parse_args()
 
+    schema_dir = args.path
+    schema_path = os.path.join(schema_dir, "schema.pickle")
+    schema_entity_path = os.path.join(schema_dir, "schema_entity.pickle")
+    if args.max_age is not None and schema_files_are_fresh(
+        [schema_path, schema_entity_path], args.max_age
+    ):
+        print(
+            "Schema files in %s are less than %s hours old, skipping them."
+            % (schema_dir, args.max_age)
+        )
+        return
+
     sg_url = args.shotgun
     sg = Shotgun(sg_url, login=input("Login: "), password=getpass.getpass())
-    schema_dir = args.path
     if not os.path.exists(schema_dir):
         os.makedirs(schema_dir)
-    mockgun.generate_schema(
-        sg,
-        os.path.join(schema_dir, "schema.pickle"),
-        os.path.join(schema_dir, "schema_entity.pickle"),
-    )
+    # Note: the Shotgun API is not thread safe, so the two schemas are read
+    # one after the other with the same connection.
+    write_pickle(sg.schema_read(), schema_path)
+    write_pickle(sg.schema_entity_read(), schema_entity_path)
 
 
 if __name__ == "__main__":
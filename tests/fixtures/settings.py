@@ -68,16 +68,14 @@ LOGGING = {
 # Sync settings. Keys are settings name.
 
 # Add the ./ folder to the Python path so test syncers can be loaded by unit tests
-sys.path.append(
-    os.path.abspath(
-        os.path.dirname(__file__),
-    )
-)
-
-# Add the ../../examples folder to the Python path so example syncers can be loaded by unit tests
-sys.path.append(
-    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "examples"))
-)
+# and the ../../examples folder so example syncers can be loaded by unit tests.
+# Settings can be read multiple times, so only add them if they are not
+# already there.
+_FIXTURES_PATH = os.path.dirname(os.path.abspath(__file__))
+_EXAMPLES_PATH = os.path.normpath(os.path.join(_FIXTURES_PATH, "..", "..", "examples"))
+for _path in (_FIXTURES_PATH, _EXAMPLES_PATH):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 SYNC = {
     "task_issue": {
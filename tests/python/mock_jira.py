@@ -5,9 +5,11 @@
 # this software in either electronic or hard copy form.
 #
 
-import copy
+import pickle
+from types import MappingProxyType
 from jira.resources import Project as JiraProject
 from jira.resources import IssueType, Issue, User, Comment, IssueLink, Worklog
+from jira.resources import dict2resource
 from jira import JIRAError
 
 # Faked Jira Project, Issue, change log and event
@@ -45,6 +47,12 @@ JIRA_USER_2 = {
     "timeZone": "America/New_York",
 }
 
+# Faked Jira users returned by MockedJira.search_assignable_users_for_issues.
+_JIRA_USERS_BY_EMAIL = {
+    JIRA_USER["emailAddress"]: JIRA_USER,
+    JIRA_USER_2["emailAddress"]: JIRA_USER_2,
+}
+
 ISSUE_FIELDS = {
     "assignee": {
         "autoCompleteUrl": "https://mocked.faked.com/rest/api/latest/user/assignable/search?project=ST3&query=",
@@ -250,18 +258,27 @@ ISSUE_FIELDS = {
     },
 }
 
-TASK_CREATE_META = {
-    "description": "A task that needs to be done.",
-    "expand": "fields",
-    "fields": ISSUE_FIELDS,
-    "iconUrl": "https://mocked.faked.com/secure/viewavatar?size=xsmall&avatarId=10318&avatarType=issuetype",
-    "id": "10000",
-    "name": "Task",
-    "self": "https://mocked.faked.com/rest/api/2/issuetype/10000",
-    "subtask": False,
-}
+# Create and edit metadata share the same read-only view of ISSUE_FIELDS.
+_ISSUE_FIELDS_PROXY = MappingProxyType(ISSUE_FIELDS)
+
+TASK_CREATE_META = MappingProxyType(
+    {
+        "description": "A task that needs to be done.",
+        "expand": "fields",
+        "fields": _ISSUE_FIELDS_PROXY,
+        "iconUrl": "https://mocked.faked.com/secure/viewavatar?size=xsmall&avatarId=10318&avatarType=issuetype",
+        "id": "10000",
+        "name": "Task",
+        "self": "https://mocked.faked.com/rest/api/2/issuetype/10000",
+        "subtask": False,
+    }
+)
 
-TASK_EDIT_META = {"fields": ISSUE_FIELDS}
+TASK_EDIT_META = MappingProxyType({"fields": _ISSUE_FIELDS_PROXY})
+
+TASK_CREATE_META_ISSUETYPES = MappingProxyType(
+    {"values": (MappingProxyType({"fields": _ISSUE_FIELDS_PROXY}),)}
+)
 
 ISSUE_BASE_RAW = {
     "expand": "renderedFields,names,schema,operations,editmeta,changelog,versionedRepresentations",
@@ -350,6 +367,12 @@ ISSUE_BASE_RAW = {
     },
 }
 
+# Prefix of the self URL of the issues created by MockedJira.
+_ISSUE_URL_PREFIX = "https://mocked.faked.com/rest/api/2/issue/"
+
+# Pickled ISSUE_BASE_RAW, unpickling it is a lot faster than deep copying it.
+_ISSUE_BASE_RAW_PICKLE = pickle.dumps(ISSUE_BASE_RAW, protocol=pickle.HIGHEST_PROTOCOL)
+
 RESOURCE_OPTIONS = {
     "rest_api_version": "2",
     "agile_rest_api_version": "1.0",
@@ -371,30 +394,1102 @@ RESOURCE_OPTIONS = {
     "rest_path": "api",
 }
 
+# Raw Jira fields data, see JIRA_FIELDS.
+_JIRA_FIELDS_RAW = (
+    {
+        "name": "Issue Type",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "issuetype",
+        "clauseNames": ["issuetype", "type"],
+        "orderable": True,
+        "id": "issuetype",
+        "schema": {"type": "issuetype", "system": "issuetype"},
+    },
+    {
+        "name": "Project",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "project",
+        "clauseNames": ["project"],
+        "orderable": False,
+        "id": "project",
+        "schema": {"type": "project", "system": "project"},
+    },
+    {
+        "name": "test extra text",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11000",
+        "clauseNames": ["cf[11000]", "test extra text"],
+        "orderable": True,
+        "id": "customfield_11000",
+        "schema": {
+            "customId": 11000,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Fix Version/s",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "fixVersions",
+        "clauseNames": ["fixVersion"],
+        "orderable": True,
+        "id": "fixVersions",
+        "schema": {
+            "items": "version",
+            "type": "array",
+            "system": "fixVersions",
+        },
+    },
+    {
+        "name": "Resolution",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "resolution",
+        "clauseNames": ["resolution"],
+        "orderable": True,
+        "id": "resolution",
+        "schema": {"type": "resolution", "system": "resolution"},
+    },
+    {
+        "name": "Implementation Details",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11400",
+        "clauseNames": ["cf[11400]", "Implementation Details"],
+        "orderable": True,
+        "id": "customfield_11400",
+        "schema": {
+            "customId": 11400,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
+        },
+    },
+    {
+        "name": "Parent Link",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10500",
+        "clauseNames": ["cf[10500]", "Parent Link"],
+        "orderable": True,
+        "id": "customfield_10500",
+        "schema": {
+            "customId": 10500,
+            "type": "any",
+            "custom": "com.atlassian.jpo:jpo-custom-field-parent",
+        },
+    },
+    {
+        "name": "Request Type",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11513",
+        "clauseNames": ["cf[11513]", "Request Type"],
+        "orderable": True,
+        "id": "customfield_11513",
+        "schema": {
+            "customId": 11513,
+            "type": "sd-customerrequesttype",
+            "custom": "com.atlassian.servicedesk:vp-origin",
+        },
+    },
+    {
+        "name": "Start date",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11512",
+        "clauseNames": ["cf[11512]", "Start date"],
+        "orderable": True,
+        "id": "customfield_11512",
+        "schema": {
+            "customId": 11512,
+            "type": "date",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:datepicker",
+        },
+    },
+    {
+        "name": "Story point estimate",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11515",
+        "clauseNames": ["cf[11515]", "Story point estimate"],
+        "orderable": True,
+        "id": "customfield_11515",
+        "schema": {
+            "customId": 11515,
+            "type": "number",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+        },
+    },
+    {
+        "name": "Team",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10700",
+        "clauseNames": ["cf[10700]", "Team"],
+        "orderable": True,
+        "id": "customfield_10700",
+        "schema": {
+            "customId": 10700,
+            "type": "any",
+            "custom": "com.atlassian.teams:rm-teams-custom-field-team",
+        },
+    },
+    {
+        "name": "Request participants",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11514",
+        "clauseNames": ["cf[11514]", "Request participants"],
+        "orderable": True,
+        "id": "customfield_11514",
+        "schema": {
+            "items": "user",
+            "customId": 11514,
+            "type": "array",
+            "custom": "com.atlassian.servicedesk:sd-request-participants",
+        },
+    },
+    {
+        "name": "Level",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10900",
+        "clauseNames": ["cf[10900]"],
+        "orderable": True,
+        "id": "customfield_10900",
+        "schema": {
+            "customId": 10900,
+            "type": "option",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
+        },
+    },
+    {
+        "name": "Issue color",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11516",
+        "clauseNames": ["cf[11516]", "Issue color"],
+        "orderable": True,
+        "id": "customfield_11516",
+        "schema": {
+            "customId": 11516,
+            "type": "string",
+            "custom": "com.pyxis.greenhopper.jira:jsw-issue-color",
+        },
+    },
+    {
+        "name": "Resolved",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "resolutiondate",
+        "clauseNames": ["resolutiondate", "resolved"],
+        "orderable": False,
+        "id": "resolutiondate",
+        "schema": {"type": "datetime", "system": "resolutiondate"},
+    },
+    {
+        "name": "Work Ratio",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "workratio",
+        "clauseNames": ["workratio"],
+        "orderable": False,
+        "id": "workratio",
+        "schema": {"type": "number", "system": "workratio"},
+    },
+    {
+        "name": "Last Viewed",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "lastViewed",
+        "clauseNames": ["lastViewed"],
+        "orderable": False,
+        "id": "lastViewed",
+        "schema": {"type": "datetime", "system": "lastViewed"},
+    },
+    {
+        "name": "Watchers",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "watches",
+        "clauseNames": ["watchers"],
+        "orderable": False,
+        "id": "watches",
+        "schema": {"type": "watches", "system": "watches"},
+    },
+    {
+        "name": "Images",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "thumbnail",
+        "clauseNames": [],
+        "orderable": False,
+        "id": "thumbnail",
+    },
+    {
+        "name": "Created",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "created",
+        "clauseNames": ["created", "createdDate"],
+        "orderable": False,
+        "id": "created",
+        "schema": {"type": "datetime", "system": "created"},
+    },
+    {
+        "name": "Priority",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "priority",
+        "clauseNames": ["priority"],
+        "orderable": True,
+        "id": "priority",
+        "schema": {"type": "priority", "system": "priority"},
+    },
+    {
+        "name": "sg_key",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10100",
+        "clauseNames": ["cf[10100]", "sg_key"],
+        "orderable": True,
+        "id": "customfield_10100",
+        "schema": {
+            "customId": 10100,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "test_int",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10101",
+        "clauseNames": ["cf[10101]", "test_int"],
+        "orderable": True,
+        "id": "customfield_10101",
+        "schema": {
+            "customId": 10101,
+            "type": "number",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+        },
+    },
+    {
+        "name": "Shotgun Status",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11511",
+        "clauseNames": ["cf[11511]", "Shotgun Status"],
+        "orderable": True,
+        "id": "customfield_11511",
+        "schema": {
+            "customId": 11511,
+            "type": "option",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
+        },
+    },
+    {
+        "name": "sg_url",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10300",
+        "clauseNames": ["cf[10300]", "sg_url"],
+        "orderable": True,
+        "id": "customfield_10300",
+        "schema": {
+            "customId": 10300,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:url",
+        },
+    },
+    {
+        "name": "Shotgun TimeLogs",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11517",
+        "clauseNames": ["cf[11517]", "Shotgun TimeLogs"],
+        "orderable": True,
+        "id": "customfield_11517",
+        "schema": {
+            "customId": 11517,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
+        },
+    },
+    {
+        "name": "Labels",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "labels",
+        "clauseNames": ["labels"],
+        "orderable": True,
+        "id": "labels",
+        "schema": {
+            "items": "string",
+            "type": "array",
+            "system": "labels",
+        },
+    },
+    {
+        "name": "Fancy Due Date 2",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11510",
+        "clauseNames": ["cf[11510]", "Fancy Due Date 2"],
+        "orderable": True,
+        "id": "customfield_11510",
+        "schema": {
+            "customId": 11510,
+            "type": "date",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:datepicker",
+        },
+    },
+    {
+        "name": "Shotgun Type",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11502",
+        "clauseNames": ["cf[11502]", "Shotgun Type"],
+        "orderable": True,
+        "id": "customfield_11502",
+        "schema": {
+            "customId": 11502,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Shotgun ID",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11501",
+        "clauseNames": ["cf[11501]", "Shotgun ID"],
+        "orderable": True,
+        "id": "customfield_11501",
+        "schema": {
+            "customId": 11501,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Changelist",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11504",
+        "clauseNames": ["cf[11504]", "Changelist"],
+        "orderable": True,
+        "id": "customfield_11504",
+        "schema": {
+            "customId": 11504,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
+        },
+    },
+    {
+        "name": "Shotgun URL",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11503",
+        "clauseNames": ["cf[11503]", "Shotgun URL"],
+        "orderable": True,
+        "id": "customfield_11503",
+        "schema": {
+            "customId": 11503,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:url",
+        },
+    },
+    {
+        "name": "Changelist3",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11506",
+        "clauseNames": ["cf[11506]", "Changelist3"],
+        "orderable": True,
+        "id": "customfield_11506",
+        "schema": {
+            "customId": 11506,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Affects Version/s",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "versions",
+        "clauseNames": ["affectedVersion"],
+        "orderable": True,
+        "id": "versions",
+        "schema": {
+            "items": "version",
+            "type": "array",
+            "system": "versions",
+        },
+    },
+    {
+        "name": "Changelist2",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11505",
+        "clauseNames": ["cf[11505]", "Changelist2"],
+        "orderable": True,
+        "id": "customfield_11505",
+        "schema": {
+            "customId": 11505,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Due Date",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11508",
+        "clauseNames": ["cf[11508]", "Due Date"],
+        "orderable": True,
+        "id": "customfield_11508",
+        "schema": {
+            "customId": 11508,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Changelist4",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11507",
+        "clauseNames": ["cf[11507]", "Changelist4"],
+        "orderable": True,
+        "id": "customfield_11507",
+        "schema": {
+            "customId": 11507,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
+        },
+    },
+    {
+        "name": "Fancy Due Date",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11509",
+        "clauseNames": ["cf[11509]", "Fancy Due Date"],
+        "orderable": True,
+        "id": "customfield_11509",
+        "schema": {
+            "customId": 11509,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Linked Issues",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "issuelinks",
+        "clauseNames": [],
+        "orderable": True,
+        "id": "issuelinks",
+        "schema": {
+            "items": "issuelinks",
+            "type": "array",
+            "system": "issuelinks",
+        },
+    },
+    {
+        "name": "Assignee",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "assignee",
+        "clauseNames": ["assignee"],
+        "orderable": True,
+        "id": "assignee",
+        "schema": {"type": "user", "system": "assignee"},
+    },
+    {
+        "name": "Updated",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "updated",
+        "clauseNames": ["updated", "updatedDate"],
+        "orderable": False,
+        "id": "updated",
+        "schema": {"type": "datetime", "system": "updated"},
+    },
+    {
+        "name": "Status",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "status",
+        "clauseNames": ["status"],
+        "orderable": False,
+        "id": "status",
+        "schema": {"type": "status", "system": "status"},
+    },
+    {
+        "name": "Component/s",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "components",
+        "clauseNames": ["component"],
+        "orderable": True,
+        "id": "components",
+        "schema": {
+            "items": "component",
+            "type": "array",
+            "system": "components",
+        },
+    },
+    {
+        "name": "Key",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "issuekey",
+        "clauseNames": ["id", "issue", "issuekey", "key"],
+        "orderable": False,
+        "id": "issuekey",
+    },
+    {
+        "name": "Description",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "description",
+        "clauseNames": ["description"],
+        "orderable": True,
+        "id": "description",
+        "schema": {"type": "string", "system": "description"},
+    },
+    {
+        "name": "Epic/Theme",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10010",
+        "clauseNames": ["cf[10010]", "Epic/Theme"],
+        "orderable": True,
+        "id": "customfield_10010",
+        "schema": {
+            "items": "string",
+            "customId": 10010,
+            "type": "array",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:labels",
+        },
+    },
+    {
+        "name": "Asset Type Old",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11100",
+        "clauseNames": ["Asset Type Old", "cf[11100]"],
+        "orderable": True,
+        "id": "customfield_11100",
+        "schema": {
+            "customId": 11100,
+            "type": "option",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
+        },
+    },
+    {
+        "name": "Story Points",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10011",
+        "clauseNames": ["cf[10011]", "Story Points"],
+        "orderable": True,
+        "id": "customfield_10011",
+        "schema": {
+            "customId": 10011,
+            "type": "number",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+        },
+    },
+    {
+        "name": "Map / Level",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11101",
+        "clauseNames": ["cf[11101]", "Map / Level"],
+        "orderable": True,
+        "id": "customfield_11101",
+        "schema": {
+            "customId": 11101,
+            "type": "option",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
+        },
+    },
+    {
+        "name": "Asset Type",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11300",
+        "clauseNames": ["Asset Type", "cf[11300]"],
+        "orderable": True,
+        "id": "customfield_11300",
+        "schema": {
+            "customId": 11300,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "DEV Quality Target",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_11500",
+        "clauseNames": ["cf[11500]", "DEV Quality Target"],
+        "orderable": True,
+        "id": "customfield_11500",
+        "schema": {
+            "customId": 11500,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Epic Name",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10005",
+        "clauseNames": ["cf[10005]", "Epic Name"],
+        "orderable": True,
+        "id": "customfield_10005",
+        "schema": {
+            "customId": 10005,
+            "type": "string",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-label",
+        },
+    },
+    {
+        "name": "Epic Color",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10006",
+        "clauseNames": ["cf[10006]", "Epic Color"],
+        "orderable": True,
+        "id": "customfield_10006",
+        "schema": {
+            "customId": 10006,
+            "type": "string",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-color",
+        },
+    },
+    {
+        "name": "Development",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10600",
+        "clauseNames": ["cf[10600]", "development"],
+        "orderable": True,
+        "id": "customfield_10600",
+        "schema": {
+            "customId": 10600,
+            "type": "any",
+            "custom": "com.atlassian.jira.plugins.jira-development-integration-plugin:devsummarycf",
+        },
+    },
+    {
+        "name": "Security Level",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "security",
+        "clauseNames": ["level"],
+        "orderable": True,
+        "id": "security",
+        "schema": {"type": "securitylevel", "system": "security"},
+    },
+    {
+        "name": "Rank",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10007",
+        "clauseNames": ["cf[10007]", "Rank"],
+        "orderable": True,
+        "id": "customfield_10007",
+        "schema": {
+            "customId": 10007,
+            "type": "any",
+            "custom": "com.pyxis.greenhopper.jira:gh-lexo-rank",
+        },
+    },
+    {
+        "name": "Organizations",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10800",
+        "clauseNames": ["cf[10800]", "Organizations"],
+        "orderable": True,
+        "id": "customfield_10800",
+        "schema": {
+            "items": "sd-customerorganization",
+            "customId": 10800,
+            "type": "array",
+            "custom": "com.atlassian.servicedesk:sd-customer-organizations",
+        },
+    },
+    {
+        "name": "Attachment",
+        "searchable": True,
+        "navigable": False,
+        "custom": False,
+        "key": "attachment",
+        "clauseNames": ["attachments"],
+        "orderable": True,
+        "id": "attachment",
+        "schema": {
+            "items": "attachment",
+            "type": "array",
+            "system": "attachment",
+        },
+    },
+    {
+        "name": "Flagged",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10009",
+        "clauseNames": ["cf[10009]", "Flagged"],
+        "orderable": True,
+        "id": "customfield_10009",
+        "schema": {
+            "items": "option",
+            "customId": 10009,
+            "type": "array",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:multicheckboxes",
+        },
+    },
+    {
+        "name": "Summary",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "summary",
+        "clauseNames": ["summary"],
+        "orderable": True,
+        "id": "summary",
+        "schema": {"type": "string", "system": "summary"},
+    },
+    {
+        "name": "Creator",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "creator",
+        "clauseNames": ["creator"],
+        "orderable": False,
+        "id": "creator",
+        "schema": {"type": "user", "system": "creator"},
+    },
+    {
+        "name": "Sub-tasks",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "subtasks",
+        "clauseNames": ["subtasks"],
+        "orderable": False,
+        "id": "subtasks",
+        "schema": {
+            "items": "issuelinks",
+            "type": "array",
+            "system": "subtasks",
+        },
+    },
+    {
+        "name": "Reporter",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "reporter",
+        "clauseNames": ["reporter"],
+        "orderable": True,
+        "id": "reporter",
+        "schema": {"type": "user", "system": "reporter"},
+    },
+    {
+        "name": "[CHART] Date of First Response",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10000",
+        "clauseNames": ["[CHART] Date of First Response", "cf[10000]"],
+        "orderable": True,
+        "id": "customfield_10000",
+        "schema": {
+            "customId": 10000,
+            "type": "datetime",
+            "custom": "com.atlassian.jira.ext.charting:firstresponsedate",
+        },
+    },
+    {
+        "name": "[CHART] Time in Status",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10001",
+        "clauseNames": ["[CHART] Time in Status", "cf[10001]"],
+        "orderable": True,
+        "id": "customfield_10001",
+        "schema": {
+            "customId": 10001,
+            "type": "any",
+            "custom": "com.atlassian.jira.ext.charting:timeinstatus",
+        },
+    },
+    {
+        "name": "Sprint",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10002",
+        "clauseNames": ["cf[10002]", "Sprint"],
+        "orderable": True,
+        "id": "customfield_10002",
+        "schema": {
+            "items": "string",
+            "customId": 10002,
+            "type": "array",
+            "custom": "com.pyxis.greenhopper.jira:gh-sprint",
+        },
+    },
+    {
+        "name": "sg_type",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10200",
+        "clauseNames": ["cf[10200]", "sg_type"],
+        "orderable": True,
+        "id": "customfield_10200",
+        "schema": {
+            "customId": 10200,
+            "type": "string",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+        },
+    },
+    {
+        "name": "Epic Link",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10003",
+        "clauseNames": ["cf[10003]", "Epic Link"],
+        "orderable": True,
+        "id": "customfield_10003",
+        "schema": {
+            "customId": 10003,
+            "type": "any",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
+        },
+    },
+    {
+        "name": "POD",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10201",
+        "clauseNames": ["cf[10201]", "POD"],
+        "orderable": True,
+        "id": "customfield_10201",
+        "schema": {
+            "items": "option",
+            "customId": 10201,
+            "type": "array",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:multiselect",
+        },
+    },
+    {
+        "name": "Approvals",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10400",
+        "clauseNames": ["Approvals", "cf[10400]"],
+        "orderable": True,
+        "id": "customfield_10400",
+        "schema": {
+            "customId": 10400,
+            "type": "sd-approvals",
+            "custom": "com.atlassian.servicedesk.approvals-plugin:sd-approvals",
+        },
+    },
+    {
+        "name": "Epic Status",
+        "searchable": True,
+        "navigable": True,
+        "custom": True,
+        "key": "customfield_10004",
+        "clauseNames": ["cf[10004]", "Epic Status"],
+        "orderable": True,
+        "id": "customfield_10004",
+        "schema": {
+            "customId": 10004,
+            "type": "option",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-status",
+        },
+    },
+    {
+        "name": "Environment",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "environment",
+        "clauseNames": ["environment"],
+        "orderable": True,
+        "id": "environment",
+        "schema": {"type": "string", "system": "environment"},
+    },
+    {
+        "name": "Due date",
+        "searchable": True,
+        "navigable": True,
+        "custom": False,
+        "key": "duedate",
+        "clauseNames": ["due", "duedate"],
+        "orderable": True,
+        "id": "duedate",
+        "schema": {"type": "date", "system": "duedate"},
+    },
+    {
+        "name": "Comment",
+        "searchable": True,
+        "navigable": False,
+        "custom": False,
+        "key": "comment",
+        "clauseNames": ["comment"],
+        "orderable": True,
+        "id": "comment",
+        "schema": {"type": "comments-page", "system": "comment"},
+    },
+    {
+        "name": "Votes",
+        "searchable": False,
+        "navigable": True,
+        "custom": False,
+        "key": "votes",
+        "clauseNames": ["votes"],
+        "orderable": False,
+        "id": "votes",
+        "schema": {"type": "votes", "system": "votes"},
+    },
+)
+
+# Jira fields returned by MockedJira.fields. Fields are shared by all
+# MockedJira instances, make them read-only.
+JIRA_FIELDS = tuple(MappingProxyType(field) for field in _JIRA_FIELDS_RAW)
+
+
+# Jira transitions returned by MockedJira.transitions.
+TRANSITIONS = (
+    {
+        "id": 1,
+        "name": "From Fake",
+        "to": {"name": "To Do"},
+    },
+)
+
+# Shared read-only response returned by MockedSession.get.
+EMPTY_RESPONSE = MappingProxyType({})
+
 
 class MockedSession(object):
     def put(self, *args, **kwargs):
         pass
 
     def get(self, *args, **kwargs):
-        return {}
+        return EMPTY_RESPONSE
+
+
+# MockedSession is stateless, a single instance is shared by all mocked issues.
+_SESSION = MockedSession()
 
 
 class MockedIssue(Issue):
     def __init__(self, *args, **kwargs):
         super(MockedIssue, self).__init__(*args, **kwargs)
-        self._worklogs = []
+        # Worklogs keyed by their id.
+        self._worklogs = {}
+        self._next_worklog_id = 1
 
     def update(self, fields, *args, **kwargs):
-        raw = self.raw
-        raw["fields"].update(fields)
-        self._parse_raw(raw)
+        raw_fields = self.raw["fields"]
+        # Nothing to do if all the fields already have the given values.
+        if all(k in raw_fields and raw_fields[k] == v for k, v in fields.items()):
+            return
+        raw_fields.update(fields)
+        # Only convert the updated fields, the other attributes of the already
+        # parsed fields are still valid.
+        dict2resource(fields, self.fields, self._options, self._session)
 
 
 class MockedComment(Comment):
-    def update(self, fields, *args, **kwargs):
+    def update(self, fields=None, *args, **kwargs):
         raw = self.raw
-        raw["fields"].update(fields)
+        if fields:
+            raw.setdefault("fields", {}).update(fields)
+        # Other values, e.g. the body, are top level comment properties.
+        raw.update(kwargs)
         self._parse_raw(raw)
 
     def delete(self):
@@ -405,13 +1500,12 @@ class MockedWorklog(Worklog):
     def update(self, *args, **kwargs):
         """Mocked Jira method to update a worklog"""
         raw = self.raw
-        for k in kwargs:
-            raw[k] = kwargs[k]
+        raw.update(kwargs)
         self._parse_raw(raw)
 
     def delete(self, *args, **kwargs):
         """Mocked Jira method to delete a worklog"""
-        self.issue._worklogs.remove(self)
+        del self.issue._worklogs[self.id]
 
 
 class MockedJira(object):
@@ -420,9 +1514,12 @@ class MockedJira(object):
     """
 
     def __init__(self, *args, **kwargs):
-        self._projects = []
-        self._createmeta = {}
+        self._projects = ()
+        self._projects_by_key = {}
+        self._createmeta = None
+        self._issue_types = {}
         self._issues = {}
+        self._next_issue_number = 0
         self._issue_links = []
 
     def set_projects(self, projects):
@@ -444,14 +1541,19 @@ class MockedJira(object):
             "expand": "description,lead,issueTypes,url,projectKeys"
         }])
         """
-        self._projects = []
-        for project in projects:
-            self._projects.append(JiraProject(None, None, raw=project))
+        self._projects = tuple(
+            JiraProject(None, None, raw=project) for project in projects
+        )
+        self._projects_by_key = dict(
+            (project.key, project) for project in self._projects
+        )
+        # Invalidate the create metadata computed for the previous projects.
+        self._createmeta = None
 
     def projects(self):
         """
         Mocked Jira method.
-        Return a list of :class:`JiraProject`.
+        Return a tuple of :class:`JiraProject`.
         """
         return self._projects
 
@@ -460,9 +1562,9 @@ class MockedJira(object):
         Mocked Jira method
         Return a :class:`JiraProject`
         """
-        for project in self._projects:
-            if project.key == project_id:
-                return project
+        project = self._projects_by_key.get(project_id)
+        if project is not None:
+            return project
         raise JIRAError("Unable to find resource Project({})".format(project_id))
 
     def createmeta_issuetypes(self, *args):
@@ -470,13 +1572,15 @@ class MockedJira(object):
         Mocked Jira method.
         Return a dictionary with create metadata for all projects.
         """
-        return {"values": [{"fields": ISSUE_FIELDS}]}
+        return TASK_CREATE_META_ISSUETYPES
 
     def createmeta(self, *args, **kwargs):
         """
         Mocked Jira method.
         Return a dictionary with create metadata for all projects.
         """
+        if self._createmeta is not None:
+            return self._createmeta
         projects_meta = []
         for project in self._projects:
             projects_meta.append(
@@ -491,10 +1595,11 @@ class MockedJira(object):
                 }
             )
 
-        return {
+        self._createmeta = {
             "expand": "projects",
             "projects": projects_meta,
         }
+        return self._createmeta
 
     def editmeta(self, issue):
         """
@@ -508,7 +1613,11 @@ class MockedJira(object):
         Mocked Jira method.
         Return a :class:`IssueType`.
         """
-        return IssueType(None, None, raw={"name": name, "id": 12345})
+        issue_type = self._issue_types.get(name)
+        if issue_type is None:
+            issue_type = IssueType(None, None, raw={"name": name, "id": 12345})
+            self._issue_types[name] = issue_type
+        return issue_type
 
     def current_user(self):
         """
@@ -527,1068 +1636,33 @@ class MockedJira(object):
     def fields(self):
         """
         Mocked Jira method.
-        Return a list of dictionaries.
+        Return a tuple of dictionaries.
         """
-        return [
-            {
-                "name": "Issue Type",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "issuetype",
-                "clauseNames": ["issuetype", "type"],
-                "orderable": True,
-                "id": "issuetype",
-                "schema": {"type": "issuetype", "system": "issuetype"},
-            },
-            {
-                "name": "Project",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "project",
-                "clauseNames": ["project"],
-                "orderable": False,
-                "id": "project",
-                "schema": {"type": "project", "system": "project"},
-            },
-            {
-                "name": "test extra text",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11000",
-                "clauseNames": ["cf[11000]", "test extra text"],
-                "orderable": True,
-                "id": "customfield_11000",
-                "schema": {
-                    "customId": 11000,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Fix Version/s",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "fixVersions",
-                "clauseNames": ["fixVersion"],
-                "orderable": True,
-                "id": "fixVersions",
-                "schema": {
-                    "items": "version",
-                    "type": "array",
-                    "system": "fixVersions",
-                },
-            },
-            {
-                "name": "Resolution",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "resolution",
-                "clauseNames": ["resolution"],
-                "orderable": True,
-                "id": "resolution",
-                "schema": {"type": "resolution", "system": "resolution"},
-            },
-            {
-                "name": "Implementation Details",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11400",
-                "clauseNames": ["cf[11400]", "Implementation Details"],
-                "orderable": True,
-                "id": "customfield_11400",
-                "schema": {
-                    "customId": 11400,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
-                },
-            },
-            {
-                "name": "Parent Link",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10500",
-                "clauseNames": ["cf[10500]", "Parent Link"],
-                "orderable": True,
-                "id": "customfield_10500",
-                "schema": {
-                    "customId": 10500,
-                    "type": "any",
-                    "custom": "com.atlassian.jpo:jpo-custom-field-parent",
-                },
-            },
-            {
-                "name": "Request Type",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11513",
-                "clauseNames": ["cf[11513]", "Request Type"],
-                "orderable": True,
-                "id": "customfield_11513",
-                "schema": {
-                    "customId": 11513,
-                    "type": "sd-customerrequesttype",
-                    "custom": "com.atlassian.servicedesk:vp-origin",
-                },
-            },
-            {
-                "name": "Start date",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11512",
-                "clauseNames": ["cf[11512]", "Start date"],
-                "orderable": True,
-                "id": "customfield_11512",
-                "schema": {
-                    "customId": 11512,
-                    "type": "date",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:datepicker",
-                },
-            },
-            {
-                "name": "Story point estimate",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11515",
-                "clauseNames": ["cf[11515]", "Story point estimate"],
-                "orderable": True,
-                "id": "customfield_11515",
-                "schema": {
-                    "customId": 11515,
-                    "type": "number",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
-                },
-            },
-            {
-                "name": "Team",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10700",
-                "clauseNames": ["cf[10700]", "Team"],
-                "orderable": True,
-                "id": "customfield_10700",
-                "schema": {
-                    "customId": 10700,
-                    "type": "any",
-                    "custom": "com.atlassian.teams:rm-teams-custom-field-team",
-                },
-            },
-            {
-                "name": "Request participants",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11514",
-                "clauseNames": ["cf[11514]", "Request participants"],
-                "orderable": True,
-                "id": "customfield_11514",
-                "schema": {
-                    "items": "user",
-                    "customId": 11514,
-                    "type": "array",
-                    "custom": "com.atlassian.servicedesk:sd-request-participants",
-                },
-            },
-            {
-                "name": "Level",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10900",
-                "clauseNames": ["cf[10900]"],
-                "orderable": True,
-                "id": "customfield_10900",
-                "schema": {
-                    "customId": 10900,
-                    "type": "option",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
-                },
-            },
-            {
-                "name": "Issue color",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11516",
-                "clauseNames": ["cf[11516]", "Issue color"],
-                "orderable": True,
-                "id": "customfield_11516",
-                "schema": {
-                    "customId": 11516,
-                    "type": "string",
-                    "custom": "com.pyxis.greenhopper.jira:jsw-issue-color",
-                },
-            },
-            {
-                "name": "Resolved",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "resolutiondate",
-                "clauseNames": ["resolutiondate", "resolved"],
-                "orderable": False,
-                "id": "resolutiondate",
-                "schema": {"type": "datetime", "system": "resolutiondate"},
-            },
-            {
-                "name": "Work Ratio",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "workratio",
-                "clauseNames": ["workratio"],
-                "orderable": False,
-                "id": "workratio",
-                "schema": {"type": "number", "system": "workratio"},
-            },
-            {
-                "name": "Last Viewed",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "lastViewed",
-                "clauseNames": ["lastViewed"],
-                "orderable": False,
-                "id": "lastViewed",
-                "schema": {"type": "datetime", "system": "lastViewed"},
-            },
-            {
-                "name": "Watchers",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "watches",
-                "clauseNames": ["watchers"],
-                "orderable": False,
-                "id": "watches",
-                "schema": {"type": "watches", "system": "watches"},
-            },
-            {
-                "name": "Images",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "thumbnail",
-                "clauseNames": [],
-                "orderable": False,
-                "id": "thumbnail",
-            },
-            {
-                "name": "Created",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "created",
-                "clauseNames": ["created", "createdDate"],
-                "orderable": False,
-                "id": "created",
-                "schema": {"type": "datetime", "system": "created"},
-            },
-            {
-                "name": "Priority",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "priority",
-                "clauseNames": ["priority"],
-                "orderable": True,
-                "id": "priority",
-                "schema": {"type": "priority", "system": "priority"},
-            },
-            {
-                "name": "sg_key",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10100",
-                "clauseNames": ["cf[10100]", "sg_key"],
-                "orderable": True,
-                "id": "customfield_10100",
-                "schema": {
-                    "customId": 10100,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "test_int",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10101",
-                "clauseNames": ["cf[10101]", "test_int"],
-                "orderable": True,
-                "id": "customfield_10101",
-                "schema": {
-                    "customId": 10101,
-                    "type": "number",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
-                },
-            },
-            {
-                "name": "Shotgun Status",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11511",
-                "clauseNames": ["cf[11511]", "Shotgun Status"],
-                "orderable": True,
-                "id": "customfield_11511",
-                "schema": {
-                    "customId": 11511,
-                    "type": "option",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
-                },
-            },
-            {
-                "name": "sg_url",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10300",
-                "clauseNames": ["cf[10300]", "sg_url"],
-                "orderable": True,
-                "id": "customfield_10300",
-                "schema": {
-                    "customId": 10300,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:url",
-                },
-            },
-            {
-                "name": "Shotgun TimeLogs",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11517",
-                "clauseNames": ["cf[11517]", "Shotgun TimeLogs"],
-                "orderable": True,
-                "id": "customfield_11517",
-                "schema": {
-                    "customId": 11517,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
-                },
-            },
-            {
-                "name": "Labels",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "labels",
-                "clauseNames": ["labels"],
-                "orderable": True,
-                "id": "labels",
-                "schema": {
-                    "items": "string",
-                    "type": "array",
-                    "system": "labels",
-                },
-            },
-            {
-                "name": "Fancy Due Date 2",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11510",
-                "clauseNames": ["cf[11510]", "Fancy Due Date 2"],
-                "orderable": True,
-                "id": "customfield_11510",
-                "schema": {
-                    "customId": 11510,
-                    "type": "date",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:datepicker",
-                },
-            },
-            {
-                "name": "Shotgun Type",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11502",
-                "clauseNames": ["cf[11502]", "Shotgun Type"],
-                "orderable": True,
-                "id": "customfield_11502",
-                "schema": {
-                    "customId": 11502,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Shotgun ID",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11501",
-                "clauseNames": ["cf[11501]", "Shotgun ID"],
-                "orderable": True,
-                "id": "customfield_11501",
-                "schema": {
-                    "customId": 11501,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Changelist",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11504",
-                "clauseNames": ["cf[11504]", "Changelist"],
-                "orderable": True,
-                "id": "customfield_11504",
-                "schema": {
-                    "customId": 11504,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
-                },
-            },
-            {
-                "name": "Shotgun URL",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11503",
-                "clauseNames": ["cf[11503]", "Shotgun URL"],
-                "orderable": True,
-                "id": "customfield_11503",
-                "schema": {
-                    "customId": 11503,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:url",
-                },
-            },
-            {
-                "name": "Changelist3",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11506",
-                "clauseNames": ["cf[11506]", "Changelist3"],
-                "orderable": True,
-                "id": "customfield_11506",
-                "schema": {
-                    "customId": 11506,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Affects Version/s",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "versions",
-                "clauseNames": ["affectedVersion"],
-                "orderable": True,
-                "id": "versions",
-                "schema": {
-                    "items": "version",
-                    "type": "array",
-                    "system": "versions",
-                },
-            },
-            {
-                "name": "Changelist2",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11505",
-                "clauseNames": ["cf[11505]", "Changelist2"],
-                "orderable": True,
-                "id": "customfield_11505",
-                "schema": {
-                    "customId": 11505,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Due Date",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11508",
-                "clauseNames": ["cf[11508]", "Due Date"],
-                "orderable": True,
-                "id": "customfield_11508",
-                "schema": {
-                    "customId": 11508,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Changelist4",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11507",
-                "clauseNames": ["cf[11507]", "Changelist4"],
-                "orderable": True,
-                "id": "customfield_11507",
-                "schema": {
-                    "customId": 11507,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
-                },
-            },
-            {
-                "name": "Fancy Due Date",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11509",
-                "clauseNames": ["cf[11509]", "Fancy Due Date"],
-                "orderable": True,
-                "id": "customfield_11509",
-                "schema": {
-                    "customId": 11509,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Linked Issues",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "issuelinks",
-                "clauseNames": [],
-                "orderable": True,
-                "id": "issuelinks",
-                "schema": {
-                    "items": "issuelinks",
-                    "type": "array",
-                    "system": "issuelinks",
-                },
-            },
-            {
-                "name": "Assignee",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "assignee",
-                "clauseNames": ["assignee"],
-                "orderable": True,
-                "id": "assignee",
-                "schema": {"type": "user", "system": "assignee"},
-            },
-            {
-                "name": "Updated",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "updated",
-                "clauseNames": ["updated", "updatedDate"],
-                "orderable": False,
-                "id": "updated",
-                "schema": {"type": "datetime", "system": "updated"},
-            },
-            {
-                "name": "Status",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "status",
-                "clauseNames": ["status"],
-                "orderable": False,
-                "id": "status",
-                "schema": {"type": "status", "system": "status"},
-            },
-            {
-                "name": "Component/s",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "components",
-                "clauseNames": ["component"],
-                "orderable": True,
-                "id": "components",
-                "schema": {
-                    "items": "component",
-                    "type": "array",
-                    "system": "components",
-                },
-            },
-            {
-                "name": "Key",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "issuekey",
-                "clauseNames": ["id", "issue", "issuekey", "key"],
-                "orderable": False,
-                "id": "issuekey",
-            },
-            {
-                "name": "Description",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "description",
-                "clauseNames": ["description"],
-                "orderable": True,
-                "id": "description",
-                "schema": {"type": "string", "system": "description"},
-            },
-            {
-                "name": "Epic/Theme",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10010",
-                "clauseNames": ["cf[10010]", "Epic/Theme"],
-                "orderable": True,
-                "id": "customfield_10010",
-                "schema": {
-                    "items": "string",
-                    "customId": 10010,
-                    "type": "array",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:labels",
-                },
-            },
-            {
-                "name": "Asset Type Old",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11100",
-                "clauseNames": ["Asset Type Old", "cf[11100]"],
-                "orderable": True,
-                "id": "customfield_11100",
-                "schema": {
-                    "customId": 11100,
-                    "type": "option",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
-                },
-            },
-            {
-                "name": "Story Points",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10011",
-                "clauseNames": ["cf[10011]", "Story Points"],
-                "orderable": True,
-                "id": "customfield_10011",
-                "schema": {
-                    "customId": 10011,
-                    "type": "number",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
-                },
-            },
-            {
-                "name": "Map / Level",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11101",
-                "clauseNames": ["cf[11101]", "Map / Level"],
-                "orderable": True,
-                "id": "customfield_11101",
-                "schema": {
-                    "customId": 11101,
-                    "type": "option",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
-                },
-            },
-            {
-                "name": "Asset Type",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11300",
-                "clauseNames": ["Asset Type", "cf[11300]"],
-                "orderable": True,
-                "id": "customfield_11300",
-                "schema": {
-                    "customId": 11300,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "DEV Quality Target",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_11500",
-                "clauseNames": ["cf[11500]", "DEV Quality Target"],
-                "orderable": True,
-                "id": "customfield_11500",
-                "schema": {
-                    "customId": 11500,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Epic Name",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10005",
-                "clauseNames": ["cf[10005]", "Epic Name"],
-                "orderable": True,
-                "id": "customfield_10005",
-                "schema": {
-                    "customId": 10005,
-                    "type": "string",
-                    "custom": "com.pyxis.greenhopper.jira:gh-epic-label",
-                },
-            },
-            {
-                "name": "Epic Color",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10006",
-                "clauseNames": ["cf[10006]", "Epic Color"],
-                "orderable": True,
-                "id": "customfield_10006",
-                "schema": {
-                    "customId": 10006,
-                    "type": "string",
-                    "custom": "com.pyxis.greenhopper.jira:gh-epic-color",
-                },
-            },
-            {
-                "name": "Development",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10600",
-                "clauseNames": ["cf[10600]", "development"],
-                "orderable": True,
-                "id": "customfield_10600",
-                "schema": {
-                    "customId": 10600,
-                    "type": "any",
-                    "custom": "com.atlassian.jira.plugins.jira-development-integration-plugin:devsummarycf",
-                },
-            },
-            {
-                "name": "Security Level",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "security",
-                "clauseNames": ["level"],
-                "orderable": True,
-                "id": "security",
-                "schema": {"type": "securitylevel", "system": "security"},
-            },
-            {
-                "name": "Rank",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10007",
-                "clauseNames": ["cf[10007]", "Rank"],
-                "orderable": True,
-                "id": "customfield_10007",
-                "schema": {
-                    "customId": 10007,
-                    "type": "any",
-                    "custom": "com.pyxis.greenhopper.jira:gh-lexo-rank",
-                },
-            },
-            {
-                "name": "Organizations",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10800",
-                "clauseNames": ["cf[10800]", "Organizations"],
-                "orderable": True,
-                "id": "customfield_10800",
-                "schema": {
-                    "items": "sd-customerorganization",
-                    "customId": 10800,
-                    "type": "array",
-                    "custom": "com.atlassian.servicedesk:sd-customer-organizations",
-                },
-            },
-            {
-                "name": "Attachment",
-                "searchable": True,
-                "navigable": False,
-                "custom": False,
-                "key": "attachment",
-                "clauseNames": ["attachments"],
-                "orderable": True,
-                "id": "attachment",
-                "schema": {
-                    "items": "attachment",
-                    "type": "array",
-                    "system": "attachment",
-                },
-            },
-            {
-                "name": "Flagged",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10009",
-                "clauseNames": ["cf[10009]", "Flagged"],
-                "orderable": True,
-                "id": "customfield_10009",
-                "schema": {
-                    "items": "option",
-                    "customId": 10009,
-                    "type": "array",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:multicheckboxes",
-                },
-            },
-            {
-                "name": "Summary",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "summary",
-                "clauseNames": ["summary"],
-                "orderable": True,
-                "id": "summary",
-                "schema": {"type": "string", "system": "summary"},
-            },
-            {
-                "name": "Creator",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "creator",
-                "clauseNames": ["creator"],
-                "orderable": False,
-                "id": "creator",
-                "schema": {"type": "user", "system": "creator"},
-            },
-            {
-                "name": "Sub-tasks",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "subtasks",
-                "clauseNames": ["subtasks"],
-                "orderable": False,
-                "id": "subtasks",
-                "schema": {
-                    "items": "issuelinks",
-                    "type": "array",
-                    "system": "subtasks",
-                },
-            },
-            {
-                "name": "Reporter",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "reporter",
-                "clauseNames": ["reporter"],
-                "orderable": True,
-                "id": "reporter",
-                "schema": {"type": "user", "system": "reporter"},
-            },
-            {
-                "name": "[CHART] Date of First Response",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10000",
-                "clauseNames": ["[CHART] Date of First Response", "cf[10000]"],
-                "orderable": True,
-                "id": "customfield_10000",
-                "schema": {
-                    "customId": 10000,
-                    "type": "datetime",
-                    "custom": "com.atlassian.jira.ext.charting:firstresponsedate",
-                },
-            },
-            {
-                "name": "[CHART] Time in Status",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10001",
-                "clauseNames": ["[CHART] Time in Status", "cf[10001]"],
-                "orderable": True,
-                "id": "customfield_10001",
-                "schema": {
-                    "customId": 10001,
-                    "type": "any",
-                    "custom": "com.atlassian.jira.ext.charting:timeinstatus",
-                },
-            },
-            {
-                "name": "Sprint",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10002",
-                "clauseNames": ["cf[10002]", "Sprint"],
-                "orderable": True,
-                "id": "customfield_10002",
-                "schema": {
-                    "items": "string",
-                    "customId": 10002,
-                    "type": "array",
-                    "custom": "com.pyxis.greenhopper.jira:gh-sprint",
-                },
-            },
-            {
-                "name": "sg_type",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10200",
-                "clauseNames": ["cf[10200]", "sg_type"],
-                "orderable": True,
-                "id": "customfield_10200",
-                "schema": {
-                    "customId": 10200,
-                    "type": "string",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-                },
-            },
-            {
-                "name": "Epic Link",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10003",
-                "clauseNames": ["cf[10003]", "Epic Link"],
-                "orderable": True,
-                "id": "customfield_10003",
-                "schema": {
-                    "customId": 10003,
-                    "type": "any",
-                    "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
-                },
-            },
-            {
-                "name": "POD",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10201",
-                "clauseNames": ["cf[10201]", "POD"],
-                "orderable": True,
-                "id": "customfield_10201",
-                "schema": {
-                    "items": "option",
-                    "customId": 10201,
-                    "type": "array",
-                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:multiselect",
-                },
-            },
-            {
-                "name": "Approvals",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10400",
-                "clauseNames": ["Approvals", "cf[10400]"],
-                "orderable": True,
-                "id": "customfield_10400",
-                "schema": {
-                    "customId": 10400,
-                    "type": "sd-approvals",
-                    "custom": "com.atlassian.servicedesk.approvals-plugin:sd-approvals",
-                },
-            },
-            {
-                "name": "Epic Status",
-                "searchable": True,
-                "navigable": True,
-                "custom": True,
-                "key": "customfield_10004",
-                "clauseNames": ["cf[10004]", "Epic Status"],
-                "orderable": True,
-                "id": "customfield_10004",
-                "schema": {
-                    "customId": 10004,
-                    "type": "option",
-                    "custom": "com.pyxis.greenhopper.jira:gh-epic-status",
-                },
-            },
-            {
-                "name": "Environment",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "environment",
-                "clauseNames": ["environment"],
-                "orderable": True,
-                "id": "environment",
-                "schema": {"type": "string", "system": "environment"},
-            },
-            {
-                "name": "Due date",
-                "searchable": True,
-                "navigable": True,
-                "custom": False,
-                "key": "duedate",
-                "clauseNames": ["due", "duedate"],
-                "orderable": True,
-                "id": "duedate",
-                "schema": {"type": "date", "system": "duedate"},
-            },
-            {
-                "name": "Comment",
-                "searchable": True,
-                "navigable": False,
-                "custom": False,
-                "key": "comment",
-                "clauseNames": ["comment"],
-                "orderable": True,
-                "id": "comment",
-                "schema": {"type": "comments-page", "system": "comment"},
-            },
-            {
-                "name": "Votes",
-                "searchable": False,
-                "navigable": True,
-                "custom": False,
-                "key": "votes",
-                "clauseNames": ["votes"],
-                "orderable": False,
-                "id": "votes",
-                "schema": {"type": "votes", "system": "votes"},
-            },
-        ]
+        return JIRA_FIELDS
 
     def create_issue(self, fields, *args, **kwargs):
         """
         Mocked Jira method.
         Return a :class:`JiraIssue`.
         """
-        issue_key = "FAKED-%03d" % len(self._issues)
-        raw = copy.deepcopy(ISSUE_BASE_RAW)
+        issue_number = self._next_issue_number
+        self._next_issue_number += 1
+        issue_key = "FAKED-%03d" % issue_number
+        raw = pickle.loads(_ISSUE_BASE_RAW_PICKLE)
         raw["fields"].update(fields)
-        raw["id"] = "%s" % len(self._issues)
+        raw["id"] = "%s" % issue_number
         raw["key"] = issue_key
-        raw["self"] = "https://mocked.faked.com/rest/api/2/issue/%s" % raw["id"]
+        raw["self"] = _ISSUE_URL_PREFIX + raw["id"]
 
-        self._issues[issue_key] = MockedIssue(
+        issue = MockedIssue(
             RESOURCE_OPTIONS,
-            MockedSession(),
+            _SESSION,
             raw=raw,
         )
-        self._issues[issue_key].key = issue_key
-        self._issues[issue_key].id = len(self._issues)
-        return self._issues[issue_key]
+        issue.key = issue_key
+        issue.id = raw["id"]
+        self._issues[issue_key] = issue
+        return issue
 
     def create_issue_link(self, type, inwardIssue, outwardIssue, comment=None):
         """
@@ -1602,20 +1676,13 @@ class MockedJira(object):
             "comment": comment,
         }
         self._issue_links.append(issue_link)
-        issue = self.issue(inwardIssue)
-        issue.update(
-            fields={
-                "issuelinks": issue.fields.issuelinks
-                + [IssueLink(None, None, raw=issue_link)]
-            }
-        )
-        issue = self.issue(outwardIssue)
-        issue.update(
-            fields={
-                "issuelinks": issue.fields.issuelinks
-                + [IssueLink(None, None, raw=issue_link)]
-            }
-        )
+        jira_issue_link = IssueLink(None, None, raw=issue_link)
+        for issue_key in (inwardIssue, outwardIssue):
+            issue = self.issue(issue_key)
+            # Append the link in place to both the raw and parsed values,
+            # instead of updating the issue with a new list.
+            issue.raw["fields"]["issuelinks"].append(jira_issue_link)
+            issue.fields.issuelinks.append(jira_issue_link)
         return issue_link
 
     def delete_issue_link(self, id):
@@ -1658,37 +1725,28 @@ class MockedJira(object):
 
     def add_worklog(self, issue, *args, **kwargs):
         """Mocked Jira method to add a worklog"""
-        raw = {"issue": issue, "id": str(len(issue._worklogs) + 1)}
-        for k in kwargs:
-            raw[k] = kwargs[k]
+        raw = {"issue": issue, "id": str(issue._next_worklog_id)}
+        issue._next_worklog_id += 1
+        raw.update(kwargs)
         worklog = MockedWorklog(None, None, raw=raw)
-        issue._worklogs.append(worklog)
+        issue._worklogs[worklog.id] = worklog
         return worklog
 
     def worklog(self, issue_key, worklog_key):
         """Mocked Jira method to retrieve a worklog associated with an issue"""
         issue = self.issue(issue_key)
-        for w in issue._worklogs:
-            if w.id == worklog_key:
-                return w
-        return None
+        return issue._worklogs.get(worklog_key)
 
     def worklogs(self, issue_key):
         """Mocked Jira method to retrieve all the worklogs associated with an issue"""
         issue = self.issue(issue_key)
-        return issue._worklogs
+        return list(issue._worklogs.values())
 
     def transitions(self, *args, **kwargs):
         """
         Mocked Jira method.
         """
-        return [
-            {
-                "id": 1,
-                "name": "From Fake",
-                "to": {"name": "To Do"},
-            }
-        ]
+        return TRANSITIONS
 
     def transition_issue(self, *args, **kwargs):
         return ""
@@ -1700,19 +1758,15 @@ class MockedJira(object):
         Mocked Jira method.
         Return a list :class:`JiraUser`.
         """
-        options = {"deployment_type": "Cloud" if self.is_jira_cloud else "Server"}
-
         if username:
             # Mock Jira REST api bug
             return []
 
-        elif query == JIRA_USER["emailAddress"]:
-            return [User(options, None, JIRA_USER)]
-
-        elif query == JIRA_USER_2["emailAddress"]:
-            return [User(options, None, JIRA_USER_2)]
-        else:
+        jira_user = _JIRA_USERS_BY_EMAIL.get(query)
+        if not jira_user:
             return []
+        options = {"deployment_type": "Cloud" if self.is_jira_cloud else "Server"}
+        return [User(options, None, jira_user)]
 
     def user(self, id, payload="username"):
         """
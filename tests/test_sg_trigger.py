@@ -6,10 +6,12 @@
 #
 
 import os
+import json
 import logging
 import datetime
 import requests
 import mock
+from concurrent.futures import ThreadPoolExecutor
 
 from shotgun_api3.lib import mockgun
 
@@ -45,7 +47,7 @@ EVENT = {
 
 def mocked_requests_post(*args, **kwargs):
     """
-    Mock requests.post made the trigger and return a Response with the url
+    Mock requests posted by the trigger and return a Response with the url
     and the payload.
     """
     response = requests.Response()
@@ -86,7 +88,9 @@ class TestSGTrigger(TestBase):
         sg_jira_event_trigger.process_event(shotgun, logger, EVENT, routing)
         self.assertTrue(PROJECT["id"] in routing)
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch.object(
+        sg_jira_event_trigger._SESSION, "post", side_effect=mocked_requests_post
+    )
     def test_project_sync_url(self, mocked):
         """
         Test retrieving the dispatch url for a Project.
@@ -127,6 +131,18 @@ class TestSGTrigger(TestBase):
         # generates 2 calls.
         self.assertEqual(mocked.call_count, 2)
         self.assertTrue(mocked.call_args[0][0].startswith(url))
+        self.assertEqual(
+            mocked.call_args[0][0],
+            "%s/%s/%d"
+            % (url, EVENT["meta"]["entity_type"], EVENT["meta"]["entity_id"]),
+        )
+        # Check the posted payload
+        payload = json.loads(mocked.call_args[1]["data"])
+        self.assertEqual(payload["meta"], EVENT["meta"])
+        self.assertEqual(payload["entity_id"], EVENT["meta"]["entity_id"])
+        self.assertEqual(
+            mocked.call_args[1]["headers"], {"Content-Type": "application/json"}
+        )
         # Check the trigger clears its routing cache if the sync url is changed
         project_event = {
             "event_type": "Shotgun_Project_Change",
@@ -159,3 +175,104 @@ class TestSGTrigger(TestBase):
         self.assertTrue(routing[PROJECT["id"]].startswith(url))
         mocked.assert_called()
         self.assertTrue(mocked.call_args[0][0].startswith(url))
+
+    @mock.patch.object(
+        sg_jira_event_trigger._SESSION, "post", side_effect=mocked_requests_post
+    )
+    def test_background_posts(self, mocked):
+        """
+        Test requests posted in the background.
+        """
+        self.set_sg_mock_schema(
+            os.path.join(
+                os.path.dirname(__file__),
+                "fixtures",
+                "schemas",
+                "sg-jira",
+            )
+        )
+        shotgun = mockgun.Shotgun("http://unit_test_mock_sg", "mock_user", "mock_key")
+        self.add_to_sg_mock_db(shotgun, PROJECT)
+        shotgun.update(
+            PROJECT["type"],
+            PROJECT["id"],
+            data={
+                "sg_jira_sync_url": {
+                    "content_type": "string",
+                    "link_type": "web",
+                    "name": "test",
+                    "url": "http://localhost/default/sg2jira",
+                }
+            },
+        )
+        executor = ThreadPoolExecutor(max_workers=1)
+        with mock.patch.object(
+            sg_jira_event_trigger, "_POST_EXECUTOR", executor
+        ), mock.patch.object(logger, "debug") as mocked_debug:
+            sg_jira_event_trigger.process_event(shotgun, logger, EVENT, {})
+            executor.shutdown(wait=True)
+        # Success is only logged once requests were posted.
+        messages = [call[0][0] for call in mocked_debug.call_args_list]
+        self.assertIn("Jira Bridge reset.", messages)
+        self.assertIn("Event successfully processed.", messages)
+        # The bridge reset is posted first, then the event.
+        self.assertEqual(
+            [
+                "http://localhost/admin/reset",
+                "http://localhost/default/sg2jira/Task/11793",
+            ],
+            [call[0][0] for call in mocked.call_args_list],
+        )
+
+        # Failures are logged instead of being raised
+        mocked.side_effect = requests.HTTPError("Failed")
+        executor = ThreadPoolExecutor(max_workers=1)
+        with mock.patch.object(
+            sg_jira_event_trigger, "_POST_EXECUTOR", executor
+        ), mock.patch.object(logger, "error") as mocked_error:
+            sg_jira_event_trigger.process_event(
+                shotgun, logger, EVENT, {PROJECT["id"]: "http://localhost/default"}
+            )
+            executor.shutdown(wait=True)
+        mocked_error.assert_called_once()
+        # All pending request slots were released.
+        for _ in range(sg_jira_event_trigger._MAX_PENDING_POSTS):
+            self.assertTrue(sg_jira_event_trigger._PENDING_POSTS.acquire(False))
+        for _ in range(sg_jira_event_trigger._MAX_PENDING_POSTS):
+            sg_jira_event_trigger._PENDING_POSTS.release()
+
+    @mock.patch.object(
+        sg_jira_event_trigger._SESSION, "post", side_effect=mocked_requests_post
+    )
+    def test_payload_serialization(self, mocked):
+        """
+        Test payloads are serialized in the same way with and without orjson.
+        """
+        self.set_sg_mock_schema(
+            os.path.join(
+                os.path.dirname(__file__),
+                "fixtures",
+                "schemas",
+                "sg-jira",
+            )
+        )
+        shotgun = mockgun.Shotgun("http://unit_test_mock_sg", "mock_user", "mock_key")
+        self.add_to_sg_mock_db(shotgun, PROJECT)
+        event = dict(EVENT)
+        event["meta"] = dict(
+            EVENT["meta"],
+            attribute_name="due_date",
+            field_data_type="date_time",
+            new_value=datetime.datetime(2024, 3, 30, 10, 1, 2),
+            old_value={1: "Ünicode"},
+        )
+        routing = {PROJECT["id"]: "http://localhost/default"}
+        sg_jira_event_trigger.process_event(shotgun, logger, event, routing)
+        with mock.patch.object(sg_jira_event_trigger, "orjson", None):
+            sg_jira_event_trigger.process_event(shotgun, logger, event, routing)
+        self.assertEqual(mocked.call_count, 2)
+        data = [call[1]["data"] for call in mocked.call_args_list]
+        self.assertEqual(data[0], data[1])
+        payload = json.loads(data[1])
+        self.assertEqual(payload["meta"]["new_value"], "2024-03-30T10:01:02")
+        self.assertEqual(payload["meta"]["old_value"], {"1": "Ünicode"})
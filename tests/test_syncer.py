@@ -436,6 +436,28 @@ class TestJiraSyncer(TestSyncBase):
         event = dict(JIRA_EVENT)
         del event["changelog"]
         self.assertFalse(syncer.accept_jira_event("Issue", "FAKED-001", event=event))
+        # Issue fields are needed
+        event = dict(JIRA_EVENT)
+        event["issue"] = {"key": "ST3-4"}
+        handler_logger = syncer._task_issue_handler._logger
+        with mock.patch.object(handler_logger, "debug") as mocked_debug:
+            self.assertFalse(
+                syncer.accept_jira_event("Issue", "FAKED-001", event=event)
+            )
+            mocked_debug.assert_any_call(
+                "Rejecting event with missing %s: %s", mock.ANY, event
+            )
+        event["issue"] = None
+        with mock.patch.object(handler_logger, "debug") as mocked_debug:
+            self.assertFalse(
+                syncer.accept_jira_event("Issue", "FAKED-001", event=event)
+            )
+            mocked_debug.assert_any_call(
+                "Rejecting event with an invalid payload (%s: %s): %s",
+                "TypeError",
+                mock.ANY,
+                event,
+            )
         # Events triggered by the syncer should be ignored
         event = dict(JIRA_EVENT)
         event["user"] = {
@@ -731,6 +753,8 @@ class TestJiraSyncer(TestSyncBase):
         issue = bridge.jira.create_issue(
             {JIRA_ISSUE_SG_TYPE_FIELD: "Task", JIRA_ISSUE_SG_ID_FIELD: 3}
         )
+        # Mocked Issues ids match their raw data, like Jira Issues.
+        self.assertEqual(issue.id, issue.raw["id"])
         self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
         sg_tags = [
             {"type": "Tag", "id": 1, "name": "foo"},
@@ -1227,6 +1251,76 @@ class TestJiraSyncer(TestSyncBase):
             )["due_date"],
         )
 
+    @mock.patch("shotgun_api3.lib.mockgun.Shotgun._validate_entity_data")
+    def test_jira_field_id_case(self, mocked_validate_fn, mocked_sg):
+        """
+        Test Jira changes are synced regardless of the case of their field id.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        sg_entity_id = int(JIRA_EVENT["issue"]["fields"]["customfield_11501"])
+        sg_entity_type = JIRA_EVENT["issue"]["fields"]["customfield_11502"]
+
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        self.add_to_sg_mock_db(
+            bridge.shotgun,
+            {
+                "type": sg_entity_type,
+                "id": sg_entity_id,
+                "content": "%s (%d)" % (sg_entity_type, sg_entity_id),
+                "project": SG_PROJECTS[0],
+            },
+        )
+        mocked_validate_fn.return_value = None
+        bridge.shotgun.update(sg_entity_type, sg_entity_id, {"due_date": "2024-03-05"})
+
+        # The change is reported for "dueDate" but the Issue payload has "duedate".
+        jira_event = dict(JIRA_EVENT)
+        jira_event["issue"]["fields"]["duedate"] = "2024-03-05"
+        change = dict(JIRA_DUEDATE_CHANGE)
+        change["fieldId"] = "dueDate"
+        jira_event["changelog"] = {"id": "123456", "items": [change]}
+        self.assertTrue(
+            bridge.sync_in_shotgun(
+                "task_issue",
+                "Issue",
+                "FAKED-01",
+                jira_event,
+            )
+        )
+        self.assertEqual(
+            "2024-03-30",
+            bridge.shotgun.find_one(
+                sg_entity_type, [["id", "is", sg_entity_id]], ["due_date"]
+            )["due_date"],
+        )
+
+    def test_shotgun_task_query_fields(self, mocked_sg):
+        """
+        Test the Task fields retrieved when processing a Flow Production Tracking
+        event.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        self.add_to_sg_mock_db(bridge.shotgun, SG_TASKS)
+        sg_task = SG_TASKS[0]
+        with mock.patch.object(
+            bridge.shotgun,
+            "consolidate_entity",
+            wraps=bridge.shotgun.consolidate_entity,
+        ) as mocked_consolidate:
+            syncer._task_issue_handler.process_shotgun_event(
+                sg_task["type"],
+                sg_task["id"],
+                {
+                    "user": {"type": "HumanUser", "id": 1},
+                    "project": {"type": "Project", "id": 1},
+                    "meta": SG_EVENT_META,
+                },
+            )
+        fields = mocked_consolidate.call_args[1]["fields"]
+        for field in ["content", "task_assignees", SHOTGUN_SYNC_IN_JIRA_FIELD]:
+            self.assertIn(field, fields)
+
     def test_jira_2_shotgun(self, mocked_sg):
         """
         Test syncing from Jira to Flow Production Tracking
@@ -1270,6 +1364,40 @@ class TestJiraSyncer(TestSyncBase):
             )
         )
 
+    def test_jira_unsupported_changes(self, mocked_sg):
+        """
+        Test Jira events without any supported change are rejected without
+        querying Flow Production Tracking.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        jira_event = dict(JIRA_EVENT)
+        jira_event["changelog"] = {
+            "id": "123456",
+            "items": [
+                {
+                    "field": "priority",
+                    "fieldId": "priority",
+                    "fieldtype": "jira",
+                    "from": "3",
+                    "fromString": "Medium",
+                    "to": "2",
+                    "toString": "High",
+                }
+            ],
+        }
+        with mock.patch.object(
+            bridge.shotgun, "consolidate_entity"
+        ) as mocked_consolidate:
+            self.assertFalse(
+                bridge.sync_in_shotgun(
+                    "task_issue",
+                    "Issue",
+                    "FAKED-01",
+                    jira_event,
+                )
+            )
+            mocked_consolidate.assert_not_called()
+
     def test_unicode(self, mocked_sg):
         """
         Test unicode values are correclty handled.
@@ -6,9 +6,17 @@
 #
 
 import os
+import json
+import atexit
+import datetime
 import logging
+import functools
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from six.moves import urllib
+from urllib3.util.retry import Retry
 
 # Allow users to define their sensitive data in a .env file and
 # load it in environment variables with python-dotenv.
@@ -17,6 +25,14 @@ from dotenv import load_dotenv
 
 load_dotenv(override=True)
 
+try:
+    # Use orjson, if available, which is a lot faster than the standard json
+    # module to serialize the events posted to the bridge.
+    # https://pypi.org/project/orjson/
+    import orjson
+except ImportError:
+    orjson = None
+
 """
 A Flow Production Tracking event daemon plugin which sends all events to the PTR/Jira bridge.
 
@@ -24,6 +40,35 @@ Flow Production Tracking Projects are associated with a Jira sync server by spec
 custom `sg_jira_sync_url` field.
 """
 
+# A session shared by all requests sent to the bridge, so connections are kept
+# alive and re-used between events instead of being opened for each of them.
+# Only failed connections are retried: POST requests are not retried by urllib3
+# once they were sent.
+_SESSION = requests.Session()
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(
+        _scheme,
+        HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        ),
+    )
+
+# An executor used to post requests to the bridge in the background, if enabled
+# with the SGDAEMON_SGJIRA_ASYNC_POSTS environment variable. It has a single
+# worker so requests are posted in the order events are processed.
+_POST_EXECUTOR = None
+
+# The maximum number of requests waiting to be posted in the background. Events
+# are not processed further until a slot is available if the bridge can't keep
+# up, instead of queueing an unbounded number of requests in memory.
+_MAX_PENDING_POSTS = 100
+_PENDING_POSTS = threading.BoundedSemaphore(_MAX_PENDING_POSTS)
+
+# Used to detect Projects without a cached dispatch route.
+_NO_ROUTE = object()
+
 # These events potentially modify the PTR schema
 SCHEMA_CHANGE_EVENT_TYPES = [
     "Shotgun_DisplayColumn_New",
@@ -34,6 +79,24 @@ SCHEMA_CHANGE_EVENT_TYPES = [
     "Shotgun_Status_Retirement",
 ]
 
+# Narrow down the list of events we pass to the bridge
+EVENT_FILTER = {
+    "Shotgun_Note_Change": ["*"],
+    "Shotgun_Task_Change": ["*"],
+    "Shotgun_Ticket_Change": ["*"],
+    "Shotgun_Project_Change": ["*"],
+    "Shotgun_Asset_Change": ["*"],  # Needed by the Asset/Task example.
+    "Shotgun_TimeLog_Change": ["*"],  # Needed by the Timelog/Task example.
+    # These events require a reset of the bridge to ensure our cached schema
+    # is up to date.
+    "Shotgun_DisplayColumn_New": ["*"],
+    "Shotgun_DisplayColumn_Change": ["*"],
+    "Shotgun_DisplayColumn_Retirement": ["*"],
+    "Shotgun_Status_New": ["*"],
+    "Shotgun_Status_Change": ["*"],
+    "Shotgun_Status_Retirement": ["*"],
+}
+
 
 def registerCallbacks(reg):
     """
@@ -42,25 +105,21 @@ def registerCallbacks(reg):
     Flow Production Tracking credentials are retrieved from the `SGDAEMON_SGJIRA_NAME` and `SGDAEMON_SGJIRA_KEY`
     environment variables.
 
+    Requests to the bridge are posted in the background, without blocking the
+    event daemon, if the `SGDAEMON_SGJIRA_ASYNC_POSTS` environment variable is
+    set to a non empty value. Failed requests are then logged as errors instead
+    of being reported to the event daemon. At most 100 requests can be pending:
+    the event daemon is blocked until a request is posted when this limit is
+    reached.
+
     :param reg: A Flow Production Tracking Event Daemon Registrar instance.
     """
-    # Narrow down the list of events we pass to the bridge
-    event_filter = {
-        "Shotgun_Note_Change": ["*"],
-        "Shotgun_Task_Change": ["*"],
-        "Shotgun_Ticket_Change": ["*"],
-        "Shotgun_Project_Change": ["*"],
-        "Shotgun_Asset_Change": ["*"],  # Needed by the Asset/Task example.
-        "Shotgun_TimeLog_Change": ["*"],  # Needed by the Timelog/Task example.
-        # These events require a reset of the bridge to ensure our cached schema
-        # is up to date.
-        "Shotgun_DisplayColumn_New": ["*"],
-        "Shotgun_DisplayColumn_Change": ["*"],
-        "Shotgun_DisplayColumn_Retirement": ["*"],
-        "Shotgun_Status_New": ["*"],
-        "Shotgun_Status_Change": ["*"],
-        "Shotgun_Status_Retirement": ["*"],
-    }
+    global _POST_EXECUTOR
+    if os.environ.get("SGDAEMON_SGJIRA_ASYNC_POSTS") and _POST_EXECUTOR is None:
+        _POST_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+        # Wait for pending requests to be posted on exit.
+        atexit.register(_POST_EXECUTOR.shutdown, wait=True)
+
     # Define a dictionary which is persisted by the framework and will collect
     # routing from Shotgun Projects.
     dispatch_routes = {}
@@ -68,7 +127,7 @@ def registerCallbacks(reg):
         os.environ["SGDAEMON_SGJIRA_NAME"],
         os.environ["SGDAEMON_SGJIRA_KEY"],
         process_event,
-        event_filter,
+        EVENT_FILTER,
         dispatch_routes,
         stopOnError=False,
     )
@@ -88,7 +147,7 @@ def process_event(sg, logger, event, dispatch_routes):
     :param event: A Flow Production Tracking EventLogEntry entity dictionary.
     :param dispatch_routes: A dictionary where keys are PTR Project ids and values urls.
     """
-    logger.debug("Processing %s" % event)
+    logger.debug("Processing %s", event)
     if event.get("event_type") in SCHEMA_CHANGE_EVENT_TYPES:
         # A schema change has occurred. Clear the dispatch routes so that
         # the next time an event is processed for a Project, the bridge will
@@ -118,7 +177,7 @@ def process_event(sg, logger, event, dispatch_routes):
     project = event.get("project")
     # If there is no Project associated with the event, just ignore it
     if not project:
-        logger.debug("Ignoring event %s not associated with any Project" % event)
+        logger.debug("Ignoring event %s not associated with any Project", event)
         return
 
     sync_server_url = _get_dispatch_route(sg, logger, project, dispatch_routes)
@@ -151,7 +210,7 @@ def process_event(sg, logger, event, dispatch_routes):
     entity_type = meta.get("entity_type")
     entity_id = meta.get("entity_id")
     if not entity_type or not entity_id:
-        logger.debug("Ignoring event. Invalid Entity meta data %s." % event)
+        logger.debug("Ignoring event. Invalid Entity meta data %s.", event)
         return
     payload = {
         "meta": meta,
@@ -163,19 +222,130 @@ def process_event(sg, logger, event, dispatch_routes):
     }
 
     # Just send a POST request with the event meta data as payload.
-    sync_url = "%s/%s/%d" % (
-        sync_server_url,
-        payload["entity_type"],
-        payload["entity_id"],
+    sync_url = "%s%d" % (
+        _get_sync_url_prefix(sync_server_url, entity_type),
+        entity_id,
     )
-    logger.debug("Posting event %s to %s" % (payload["meta"], sync_url))
+    logger.debug("Posting event %s to %s", payload["meta"], sync_url)
     # Post application/json request
-    response = requests.post(
+    _post(
+        logger,
         sync_url,
-        json=payload,
+        "Event successfully processed.",
+        data=_serialize_payload(payload),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def _post(logger, url, success_message, **kwargs):
+    """
+    Post a request to the bridge.
+
+    The request is posted in the background if background posting is enabled,
+    otherwise it is posted immediately. In both cases, the given success message
+    is only logged once the request was successfully posted.
+
+    If background posting is enabled and too many requests are already pending,
+    block until one of them is posted.
+
+    :param logger: Logger instance.
+    :param str url: The url to post the request to.
+    :param str success_message: A message to log if the request succeeded.
+    :param kwargs: Additional parameters for :meth:`requests.Session.post`.
+    :raises requests.HTTPError: if the request failed and was posted immediately.
+    """
+    if _POST_EXECUTOR is None:
+        _send_post(url, **kwargs)
+        logger.debug(success_message)
+        return
+    _PENDING_POSTS.acquire()
+    try:
+        future = _POST_EXECUTOR.submit(_send_post, url, **kwargs)
+    except Exception:
+        _PENDING_POSTS.release()
+        raise
+    future.add_done_callback(
+        functools.partial(_log_post_result, logger, url, success_message, kwargs)
     )
+
+
+def _send_post(url, **kwargs):
+    """
+    Post a request to the bridge and check its result.
+
+    :param str url: The url to post the request to.
+    :param kwargs: Additional parameters for :meth:`requests.Session.post`.
+    :raises requests.HTTPError: if the request failed.
+    """
+    response = _SESSION.post(url, **kwargs)
     response.raise_for_status()
-    logger.debug("Event successfully processed.")
+
+
+def _log_post_result(logger, url, success_message, kwargs, future):
+    """
+    Log the result of the request posted in the background by the given future
+    and release its pending request slot.
+
+    The request data is logged on errors so it can be posted again if needed.
+
+    :param logger: Logger instance.
+    :param str url: The url the request was posted to.
+    :param str success_message: A message to log if the request succeeded.
+    :param dict kwargs: The parameters used to post the request.
+    :param future: A :class:`concurrent.futures.Future` instance.
+    """
+    _PENDING_POSTS.release()
+    error = future.exception()
+    if error:
+        logger.error("Unable to post %s to %s: %s" % (kwargs.get("data"), url, error))
+    else:
+        logger.debug(success_message)
+
+
+def _serialize_payload(payload):
+    """
+    Serialize the given payload to JSON.
+
+    The same JSON is produced with or without orjson: dates and times are
+    serialized as ISO 8601 strings and non string keys are converted to strings.
+
+    :param dict payload: The payload to serialize.
+    :returns: The UTF-8 encoded JSON payload as bytes.
+    """
+    if orjson:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        payload, default=_serialize_value, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _serialize_value(value):
+    """
+    Return a JSON serializable value for the given value, like orjson does.
+
+    :param value: A value which can't be serialized by the json module.
+    :returns: An ISO 8601 string for dates and times.
+    :raises TypeError: if the value can't be serialized.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError("Object of type %s is not JSON serializable" % type(value).__name__)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_sync_url_prefix(sync_server_url, entity_type):
+    """
+    Return the sync url prefix for the given sync server url and Entity type.
+
+    Prefixes are cached by sync server url and Entity type, so they never need
+    to be invalidated when routes change. Only the most recently used ones are
+    kept.
+
+    :param str sync_server_url: Sync url of the PTR Jira Bridge.
+    :param str entity_type: A Flow Production Tracking Entity type.
+    :returns: The sync url prefix, ending with a "/", as a str.
+    """
+    return "%s/%s/" % (sync_server_url, entity_type)
 
 
 def _get_dispatch_route(sg, logger, project, dispatch_routes):
@@ -190,7 +360,10 @@ def _get_dispatch_route(sg, logger, project, dispatch_routes):
     """
     # Shotgun requests are costly so we cache Projects dispatch routes and re-use
     # them when we treat an event for a Project we handled before.
-    if project["id"] not in dispatch_routes:
+    # Note: cached routes can be None, so a sentinel is used to detect cache misses
+    # with a single lookup.
+    sync_url = dispatch_routes.get(project["id"], _NO_ROUTE)
+    if sync_url is _NO_ROUTE:
         # This is the first time we're treating an event for this Project, get the
         # routing, if any, from Shotgun.
         logger.info("Retrieving sync routing for Project %d" % project["id"])
@@ -218,7 +391,7 @@ def _get_dispatch_route(sg, logger, project, dispatch_routes):
         if sync_url:
             _reset_bridge(sync_url, logger)
 
-    return dispatch_routes[project["id"]]
+    return sync_url
 
 
 def _get_project_sync_url(sg_field_value, logger):
@@ -244,8 +417,10 @@ def _get_project_sync_url(sg_field_value, logger):
     if isinstance(sg_field_value, dict):
         if sg_field_value.get("link_type") == "web":
             sync_url = sg_field_value.get("url")
-            if sync_url and sync_url.endswith("/"):
-                sync_url = sync_url[:-1]
+            # Normalize the url once when it is cached, so events can always
+            # append paths to it with a single "/".
+            if sync_url:
+                sync_url = sync_url.rstrip("/")
 
     # There is a value in the sg_field_value but it's not what we expect.
     if sync_url is None and sg_field_value:
@@ -277,6 +452,4 @@ def _reset_bridge(server_url, logger):
 
     reset_url = "%s://%s/admin/reset" % (parsed_url.scheme, parsed_url.netloc)
     logger.debug("Posting to %s" % reset_url)
-    response = requests.post(reset_url)
-    response.raise_for_status()
-    logger.debug("Jira Bridge reset.")
+    _post(logger, reset_url, "Jira Bridge reset.")